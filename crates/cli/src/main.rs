@@ -384,6 +384,37 @@ fn prepare_audio(inputs: &[PathBuf], work_dir: &std::path::Path) -> Result<Vec<P
     Ok(audio_paths)
 }
 
+/// Zip every WAV in `clips_dir` into `zip_path`, returning the entry count.
+///
+/// Entries are sorted by name so archives are reproducible, and each file
+/// is streamed into the archive rather than read into memory first.
+/// Entries are stored uncompressed.
+/// Names come straight from the directory listing, so they are already
+/// unique.
+fn write_clips_zip(clips_dir: &std::path::Path, zip_path: &std::path::Path) -> Result<usize> {
+    let mut wavs: Vec<PathBuf> = std::fs::read_dir(clips_dir)?
+        .filter_map(|entry| entry.ok().map(|e| e.path()))
+        .filter(|path| path.extension().map(|e| e == "wav").unwrap_or(false))
+        .collect();
+    wavs.sort();
+
+    let zip_file = std::fs::File::create(zip_path)?;
+    let mut zip = zip::ZipWriter::new(zip_file);
+    // PCM audio barely deflates, so store entries uncompressed and skip
+    // the zlib work entirely.
+    let options = zip::write::SimpleFileOptions::default()
+        .compression_method(zip::CompressionMethod::Stored);
+
+    for path in &wavs {
+        let name = path.file_name().unwrap().to_string_lossy().to_string();
+        zip.start_file(name, options)?;
+        let mut file = std::fs::File::open(path)?;
+        std::io::copy(&mut file, &mut zip)?;
+    }
+    zip.finish()?;
+    Ok(wavs.len())
+}
+
 // ─── Collage runner ──────────────────────────────────────────────
 
 fn run_collage(args: CollageArgs) -> Result<()> {
@@ -489,23 +520,8 @@ fn run_collage(args: CollageArgs) -> Result<()> {
         .to_string_lossy();
     let zip_path = run_dir.join(format!("{}-clips.zip", run_name));
     if clips_dir.is_dir() {
-        let zip_file = std::fs::File::create(&zip_path)?;
-        let mut zip = zip::ZipWriter::new(zip_file);
-        let options = zip::write::SimpleFileOptions::default()
-            .compression_method(zip::CompressionMethod::Deflated);
-
-        for entry in std::fs::read_dir(&clips_dir)? {
-            let entry = entry?;
-            let path = entry.path();
-            if path.extension().map(|e| e == "wav").unwrap_or(false) {
-                let name = path.file_name().unwrap().to_string_lossy().to_string();
-                zip.start_file(&name, options)?;
-                let data = std::fs::read(&path)?;
-                std::io::Write::write_all(&mut zip, &data)?;
-            }
-        }
-        zip.finish()?;
-        log::info!("Created {}", zip_path.display());
+        let count = write_clips_zip(&clips_dir, &zip_path)?;
+        log::info!("Created {} ({} clips)", zip_path.display(), count);
     }
 
     println!("Processed {} source file(s)", args.shared.input_files.len());
@@ -780,3 +796,69 @@ fn run_speak(args: SpeakArgs) -> Result<()> {
 
     Ok(())
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use clap::CommandFactory;
+
+    /// The CLI's clap command, built once and shared across tests.
+    fn cli_command() -> &'static clap::Command {
+        static COMMAND: std::sync::OnceLock<clap::Command> = std::sync::OnceLock::new();
+        COMMAND.get_or_init(Cli::command)
+    }
+
+    /// Long flag names accepted by a subcommand, without the leading `--`.
+    fn subcommand_longs(name: &str) -> Vec<String> {
+        cli_command()
+            .find_subcommand(name)
+            .unwrap()
+            .get_arguments()
+            .filter_map(|a| a.get_long().map(str::to_string))
+            .collect()
+    }
+
+    #[test]
+    fn test_cli_definition() {
+        Cli::command().debug_assert();
+    }
+
+    #[test]
+    fn test_collage_flags() {
+        let longs = subcommand_longs("collage");
+        assert!(longs.iter().any(|l| l == "target-duration"));
+        assert!(longs.iter().any(|l| l == "syllables-per-word"));
+    }
+
+    #[test]
+    fn test_sing_flags() {
+        assert!(subcommand_longs("sing").iter().any(|l| l == "midi"));
+    }
+
+    #[test]
+    fn test_parse_sing_args() {
+        let cli = Cli::try_parse_from([
+            "glottisdale",
+            "sing",
+            "a.wav",
+            "--midi",
+            "songs",
+            "--no-vibrato",
+        ])
+        .unwrap();
+        match cli.command {
+            Command::Sing(args) => {
+                assert_eq!(args.midi, PathBuf::from("songs"));
+                assert_eq!(args.shared.input_files, vec![PathBuf::from("a.wav")]);
+                assert!(args.no_vibrato);
+            }
+            _ => panic!("expected sing subcommand"),
+        }
+    }
+
+    #[test]
+    fn test_help_flag_exits_with_help() {
+        let err = Cli::try_parse_from(["glottisdale", "sing", "--help"]).err().unwrap();
+        assert_eq!(err.kind(), clap::error::ErrorKind::DisplayHelp);
+    }
+}
@@ -4,13 +4,28 @@
 use rand::rngs::StdRng;
 use rand::{Rng, SeedableRng};
 
+/// Sum of squared samples.
+///
+/// Accumulates into four independent lanes so the compiler can vectorize the
+/// loop; a single running f64 sum is a serial dependency chain it must keep.
+fn sum_squares(samples: &[f64]) -> f64 {
+    let chunks = samples.chunks_exact(4);
+    let tail: f64 = chunks.remainder().iter().map(|s| s * s).sum();
+    let mut acc = [0.0f64; 4];
+    for c in chunks {
+        for (a, s) in acc.iter_mut().zip(c) {
+            *a += s * s;
+        }
+    }
+    (acc[0] + acc[1]) + (acc[2] + acc[3]) + tail
+}
+
 /// Compute RMS energy of the entire signal.
 pub fn compute_rms(samples: &[f64]) -> f64 {
     if samples.is_empty() {
         return 0.0;
     }
-    let sum_sq: f64 = samples.iter().map(|s| s * s).sum();
-    (sum_sq / samples.len() as f64).sqrt()
+    (sum_squares(samples) / samples.len() as f64).sqrt()
 }
 
 /// Compute RMS energy in sliding windows.
@@ -30,8 +45,7 @@ pub fn compute_rms_windowed(samples: &[f64], sr: u32, window_ms: u32, hop_ms: u3
     for i in 0..n_frames {
         let start = i * hop_samples;
         let frame = &samples[start..start + window_samples];
-        let sum_sq: f64 = frame.iter().map(|s| s * s).sum();
-        rms.push((sum_sq / window_samples as f64).sqrt());
+        rms.push((sum_squares(frame) / window_samples as f64).sqrt());
     }
 
     rms
@@ -128,39 +142,41 @@ pub fn estimate_f0(samples: &[f64], sr: u32, f0_min: u32, f0_max: u32) -> Option
     let mean: f64 = samples.iter().sum::<f64>() / samples.len() as f64;
     let x: Vec<f64> = samples.iter().map(|s| s - mean).collect();
 
-    let autocorr_0: f64 = x.iter().map(|v| v * v).sum();
+    let autocorr_0 = sum_squares(&x);
     if autocorr_0 < 1e-12 {
         return None;
     }
 
-    // Compute normalized autocorrelation for the valid lag range
-    let n_lags = lag_max - lag_min + 1;
-    let mut autocorr = Vec::with_capacity(n_lags);
-    for lag in lag_min..=lag_max {
+    // Normalized autocorrelation at one lag
+    let autocorr = |lag: usize| -> f64 {
         let sum: f64 = x[..x.len() - lag]
             .iter()
             .zip(x[lag..].iter())
             .map(|(a, b)| a * b)
             .sum();
-        autocorr.push(sum / autocorr_0);
-    }
+        sum / autocorr_0
+    };
 
     let threshold = 0.3;
 
+    // Lags are evaluated lazily with a three-value window, so the scan stops
+    // at the first peak instead of correlating every lag up to lag_max.
+    let mut prev = autocorr(lag_min);
+    let mut cur = autocorr(lag_min + 1);
+
     // Check left boundary
-    if autocorr.len() >= 2 && autocorr[0] >= threshold && autocorr[0] >= autocorr[1] {
+    if prev >= threshold && prev >= cur {
         return Some(sr as f64 / lag_min as f64);
     }
 
     // Scan interior points for first peak above threshold
-    for i in 1..autocorr.len().saturating_sub(1) {
-        if autocorr[i] >= threshold
-            && autocorr[i] >= autocorr[i - 1]
-            && autocorr[i] >= autocorr[i + 1]
-        {
-            let best_lag = lag_min + i;
-            return Some(sr as f64 / best_lag as f64);
+    for lag in lag_min + 1..lag_max {
+        let next = autocorr(lag + 1);
+        if cur >= threshold && cur >= prev && cur >= next {
+            return Some(sr as f64 / lag as f64);
         }
+        prev = cur;
+        cur = next;
     }
 
     None
@@ -269,12 +285,8 @@ fn voss_mccartney_pink_noise(n_samples: usize, rng: &mut StdRng) -> Vec<f64> {
 
     for i in 0..n_samples {
         // Determine which rows to update based on trailing zeros of index
-        let mut changed = i;
-        let mut num_zeros = 0;
-        while changed != 0 && (changed & 1) == 0 {
-            num_zeros += 1;
-            changed >>= 1;
-        }
+        // (index 0 updates row 0)
+        let num_zeros = if i == 0 { 0 } else { i.trailing_zeros() as usize };
 
         if num_zeros < NUM_ROWS {
             running_sum -= rows[num_zeros];
@@ -308,6 +320,12 @@ mod tests {
         assert_eq!(compute_rms(&[0.0; 100]), 0.0);
     }
 
+    #[test]
+    fn test_compute_rms_uneven_length() {
+        // Length not a multiple of four exercises the tail: sqrt(50 / 5)
+        assert!((compute_rms(&[3.0, 4.0, 0.0, 0.0, 5.0]) - 10.0f64.sqrt()).abs() < 1e-12);
+    }
+
     #[test]
     fn test_compute_rms_known_signal() {
         // DC signal of 0.5 → RMS = 0.5
@@ -406,15 +424,20 @@ mod tests {
         assert!(find_breaths(&[0.0; 100], 16000, &[(0.0, 0.5)], 200, 600).is_empty());
     }
 
+    /// One second of seeded pink noise at 16kHz, generated once per test binary.
+    fn pink_noise_1s() -> &'static [f64] {
+        static NOISE: std::sync::OnceLock<Vec<f64>> = std::sync::OnceLock::new();
+        NOISE.get_or_init(|| generate_pink_noise(1.0, 16000, Some(42)))
+    }
+
     #[test]
     fn test_generate_pink_noise_length() {
-        let noise = generate_pink_noise(1.0, 16000, Some(42));
-        assert_eq!(noise.len(), 16000);
+        assert_eq!(pink_noise_1s().len(), 16000);
     }
 
     #[test]
     fn test_generate_pink_noise_normalized() {
-        let noise = generate_pink_noise(1.0, 16000, Some(42));
+        let noise = pink_noise_1s();
         let peak = noise.iter().map(|v| v.abs()).fold(0.0f64, f64::max);
         assert!((peak - 1.0).abs() < 0.01, "Should be normalized, peak = {}", peak);
     }
@@ -3,6 +3,8 @@
 
 use anyhow::Result;
 
+use crate::audio::analysis::{compute_rms, estimate_f0};
+
 /// Cut an audio segment with padding and fade.
 ///
 /// `start` and `end` are in seconds. Padding extends the clip on both sides.
@@ -240,9 +242,98 @@ pub fn mix_audio(primary: &[f64], secondary: &[f64], secondary_volume_db: f64) -
     result
 }
 
+/// Normalize volume across clips to median RMS (in-memory).
+///
+/// Gain changes are clamped to +/-20 dB and skipped below 0.5 dB.
+pub fn normalize_volume_clips(clips: &mut [Vec<f64>]) {
+    let rms_values: Vec<f64> = clips
+        .iter()
+        .map(|c| compute_rms(c))
+        .filter(|&r| r > 1e-6)
+        .collect();
+
+    if rms_values.is_empty() {
+        return;
+    }
+
+    let mut sorted = rms_values.clone();
+    sorted.sort_by(|a, b| a.partial_cmp(b).unwrap());
+    let target_rms = sorted[sorted.len() / 2];
+
+    if target_rms < 1e-6 {
+        return;
+    }
+
+    for clip in clips.iter_mut() {
+        let clip_rms = compute_rms(clip);
+        if clip_rms < 1e-6 {
+            continue;
+        }
+        let db_adjust = 20.0 * (target_rms / clip_rms).log10();
+        let db_adjust = db_adjust.clamp(-20.0, 20.0);
+        if db_adjust.abs() >= 0.5 {
+            adjust_volume(clip, db_adjust);
+        }
+    }
+}
+
+/// Minimum F0 target for [`normalize_pitch_clips`] (Hz).
+/// Prevents the median from settling too low when source material is bass-heavy.
+const MIN_PITCH_TARGET_HZ: f64 = 160.0;
+
+/// Normalize pitch across clips toward median F0 (in-memory).
+pub fn normalize_pitch_clips(clips: &mut [Vec<f64>], sr: u32, pitch_range: f64) {
+    let f0_values: Vec<(usize, f64)> = clips
+        .iter()
+        .enumerate()
+        .filter_map(|(i, c)| estimate_f0(c, sr, 80, 600).map(|f0| (i, f0)))
+        .collect();
+
+    if f0_values.is_empty() {
+        return;
+    }
+
+    let mut sorted_f0s: Vec<f64> = f0_values.iter().map(|(_, f0)| *f0).collect();
+    sorted_f0s.sort_by(|a, b| a.partial_cmp(b).unwrap());
+    let median_f0 = sorted_f0s[sorted_f0s.len() / 2];
+    let target_f0 = median_f0.max(MIN_PITCH_TARGET_HZ);
+
+    log::info!(
+        "Pitch normalization: median F0 = {:.1}Hz, target F0 = {:.1}Hz (from {} voiced clips)",
+        median_f0,
+        target_f0,
+        f0_values.len()
+    );
+
+    for (i, f0) in &f0_values {
+        let semitones_shift = 12.0 * (target_f0 / f0).log2();
+        let semitones_shift = semitones_shift.clamp(-pitch_range, pitch_range);
+        if semitones_shift.abs() >= 0.1 {
+            if let Ok(shifted) = pitch_shift(&clips[*i], sr, semitones_shift) {
+                clips[*i] = shifted;
+            }
+        }
+    }
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
+    use std::sync::OnceLock;
+
+    /// `secs` of a sine at `freq` Hz and amplitude `amp`.
+    fn sine(freq: f64, sr: u32, secs: f64, amp: f64) -> Vec<f64> {
+        let step = std::f64::consts::TAU * freq / sr as f64;
+        (0..(secs * sr as f64) as usize)
+            .map(|i| (step * i as f64).sin() * amp)
+            .collect()
+    }
+
+    /// One second of a full-scale 440Hz sine at 16kHz, built once per test binary.
+    fn tone_440() -> &'static [f64] {
+        static TONE: OnceLock<Vec<f64>> = OnceLock::new();
+        TONE.get_or_init(|| sine(440.0, 16000, 1.0, 1.0))
+    }
 
     #[test]
     fn test_cut_clip_basic() {
@@ -378,13 +469,8 @@ mod tests {
 
     #[test]
     fn test_pitch_shift_native_up() {
-        // 1 second of 440Hz sine at 16kHz
-        let sr = 16000u32;
-        let samples: Vec<f64> = (0..sr as usize)
-            .map(|i| (2.0 * std::f64::consts::PI * 440.0 * i as f64 / sr as f64).sin())
-            .collect();
-
-        let result = pitch_shift(&samples, sr, 2.0).unwrap();
+        let samples = tone_440();
+        let result = pitch_shift(samples, 16000, 2.0).unwrap();
         // Should preserve length (not change speed)
         assert!(
             (result.len() as f64 - samples.len() as f64).abs() < 100.0,
@@ -399,12 +485,8 @@ mod tests {
 
     #[test]
     fn test_time_stretch_native_double() {
-        let sr = 16000u32;
-        let samples: Vec<f64> = (0..sr as usize)
-            .map(|i| (2.0 * std::f64::consts::PI * 440.0 * i as f64 / sr as f64).sin())
-            .collect();
-
-        let result = time_stretch(&samples, sr, 2.0).unwrap();
+        let samples = tone_440();
+        let result = time_stretch(samples, 16000, 2.0).unwrap();
         // Factor 2.0 = twice as long
         let expected_len = samples.len() * 2;
         assert!(
@@ -414,4 +496,56 @@ mod tests {
             result.len()
         );
     }
+
+    #[test]
+    fn test_normalize_volume_clips() {
+        let mut clips = vec![
+            vec![0.5; 100],   // RMS ~0.5
+            vec![0.1; 100],   // RMS ~0.1
+            vec![0.3; 100],   // RMS ~0.3
+        ];
+        normalize_volume_clips(&mut clips);
+        // After normalization, RMS values should be closer together
+        let rms_after: Vec<f64> = clips.iter().map(|c| compute_rms(c)).collect();
+        let range_before = 0.5 - 0.1; // 0.4
+        let range_after = rms_after.iter().cloned().fold(f64::NEG_INFINITY, f64::max)
+            - rms_after.iter().cloned().fold(f64::INFINITY, f64::min);
+        assert!(range_after < range_before);
+    }
+
+    #[test]
+    fn test_normalize_volume_clips_tones() {
+        let loud: Vec<f64> = tone_440().iter().map(|s| s * 0.8).collect();
+        let quiet: Vec<f64> = tone_440().iter().map(|s| s * 0.1).collect();
+        let mut clips = vec![loud.clone(), quiet, loud];
+        normalize_volume_clips(&mut clips);
+        // The quiet clip is boosted to the median (loud) level
+        let rms = compute_rms(&clips[1]);
+        assert!((rms - compute_rms(&clips[0])).abs() < 0.01, "RMS after: {}", rms);
+    }
+
+    #[test]
+    fn test_normalize_pitch_shifts_outlier_toward_median() {
+        // 8kHz is plenty for 200/400Hz tones and halves the DSP work
+        let sr = 8000;
+        let low = sine(200.0, sr, 0.5, 0.5);
+        let high = sine(400.0, sr, 0.5, 0.5);
+        let mut clips = vec![low.clone(), low.clone(), low.clone(), high.clone()];
+        normalize_pitch_clips(&mut clips, sr, 12.0);
+        // Clips already at the median are left alone; the outlier is shifted
+        for clip in &clips[..3] {
+            assert_eq!(clip, &low);
+        }
+        assert_ne!(clips[3], high);
+    }
+
+    #[test]
+    fn test_normalize_volume_silent_clips() {
+        let mut clips = vec![
+            vec![0.0; 100],  // silent
+            vec![0.5; 100],
+        ];
+        // Should not crash on silent clips
+        normalize_volume_clips(&mut clips);
+    }
 }
@@ -17,42 +17,24 @@ pub fn read_wav(path: &Path) -> Result<(Vec<f64>, u32)> {
     let sample_rate = spec.sample_rate;
     let channels = spec.channels as usize;
 
-    let samples: Vec<f64> = match spec.sample_format {
+    // Take the first channel only. step_by still pulls (and discards) the
+    // other channels' samples. Collecting a Result iterator can't see the
+    // length, so size the buffer from the header up front.
+    let mut samples = Vec::with_capacity(reader.len() as usize / channels.max(1));
+    match spec.sample_format {
         SampleFormat::Int => {
             let bits = spec.bits_per_sample;
             let max_val = (1i64 << (bits - 1)) as f64;
-            reader
-                .into_samples::<i32>()
-                .enumerate()
-                .filter_map(|(i, s)| {
-                    // Take first channel only
-                    if i % channels == 0 {
-                        Some(s.map(|v| v as f64 / max_val))
-                    } else {
-                        // Still consume the sample to advance the iterator
-                        let _ = s;
-                        None
-                    }
-                })
-                .collect::<std::result::Result<Vec<_>, _>>()
-                .context("Failed to read WAV samples")?
+            for s in reader.into_samples::<i32>().step_by(channels) {
+                samples.push(s.context("Failed to read WAV samples")? as f64 / max_val);
+            }
         }
         SampleFormat::Float => {
-            reader
-                .into_samples::<f32>()
-                .enumerate()
-                .filter_map(|(i, s)| {
-                    if i % channels == 0 {
-                        Some(s.map(|v| v as f64))
-                    } else {
-                        let _ = s;
-                        None
-                    }
-                })
-                .collect::<std::result::Result<Vec<_>, _>>()
-                .context("Failed to read WAV samples")?
+            for s in reader.into_samples::<f32>().step_by(channels) {
+                samples.push(s.context("Failed to read WAV samples")? as f64);
+            }
         }
-    };
+    }
 
     Ok((samples, sample_rate))
 }
@@ -74,14 +56,19 @@ pub fn write_wav(path: &Path, samples: &[f64], sample_rate: u32) -> Result<()> {
         sample_format: SampleFormat::Int,
     };
 
+    let num_samples = u32::try_from(samples.len()).context("Too many samples for a WAV file")?;
+
     let mut writer = WavWriter::create(path, spec)
         .with_context(|| format!("Failed to create WAV file: {}", path.display()))?;
 
+    // The i16 writer buffers the whole clip and flushes it in one write,
+    // instead of a checked write_sample call per sample
+    let mut int16_writer = writer.get_i16_writer(num_samples);
     for &sample in samples {
         let clipped = sample.clamp(-1.0, 1.0);
-        let int16 = (clipped * 32767.0) as i16;
-        writer.write_sample(int16)?;
+        int16_writer.write_sample((clipped * 32767.0) as i16);
     }
+    int16_writer.flush().context("Failed to write WAV samples")?;
 
     writer.finalize().context("Failed to finalize WAV file")?;
     Ok(())
@@ -254,7 +241,8 @@ mod tests {
     use std::path::PathBuf;
 
     fn temp_wav_path(name: &str) -> PathBuf {
-        let dir = std::env::temp_dir().join("glottisdale_test_io");
+        let dir = std::env::temp_dir()
+            .join(format!("glottisdale_test_io_{}", std::process::id()));
         std::fs::create_dir_all(&dir).unwrap();
         dir.join(name)
     }
@@ -291,6 +279,42 @@ mod tests {
         std::fs::remove_file(&path).ok();
     }
 
+    #[test]
+    fn test_read_wav_stereo_takes_first_channel() {
+        let path = temp_wav_path("stereo.wav");
+        let spec = WavSpec {
+            channels: 2,
+            sample_rate: 8000,
+            bits_per_sample: 16,
+            sample_format: SampleFormat::Int,
+        };
+        let mut writer = WavWriter::create(&path, spec).unwrap();
+        for _ in 0..10 {
+            writer.write_sample(16384i16).unwrap(); // left
+            writer.write_sample(-16384i16).unwrap(); // right
+        }
+        writer.finalize().unwrap();
+
+        let (read, sr) = read_wav(&path).unwrap();
+        assert_eq!(sr, 8000);
+        assert_eq!(read.len(), 10);
+        assert!(read.iter().all(|&s| (s - 0.5).abs() < 1e-9));
+
+        std::fs::remove_file(&path).ok();
+    }
+
+    #[test]
+    fn test_write_empty_wav() {
+        let path = temp_wav_path("empty.wav");
+        write_wav(&path, &[], 16000).unwrap();
+
+        let (read, sr) = read_wav(&path).unwrap();
+        assert_eq!(sr, 16000);
+        assert!(read.is_empty());
+
+        std::fs::remove_file(&path).ok();
+    }
+
     #[test]
     fn test_get_wav_duration() {
         let path = temp_wav_path("duration.wav");
@@ -344,7 +368,8 @@ mod tests {
     #[test]
     fn test_extract_audio_native_wav() {
         // Create a WAV file, then extract it via the native path
-        let dir = std::env::temp_dir().join("glottisdale_test_extract");
+        let dir = std::env::temp_dir()
+            .join(format!("glottisdale_test_extract_{}", std::process::id()));
         std::fs::create_dir_all(&dir).unwrap();
 
         let input = dir.join("input.wav");
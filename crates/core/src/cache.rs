@@ -3,6 +3,7 @@
 //! Provides SHA-256 file hashing and caching for audio extraction,
 //! Whisper transcription, and alignment results.
 
+use std::io::BufReader;
 use std::path::{Path, PathBuf};
 
 use anyhow::{Context, Result};
@@ -21,14 +22,20 @@ pub fn cache_dir() -> PathBuf {
     PathBuf::from(home).join(".cache").join("glottisdale")
 }
 
+/// Read buffer for [`file_hash`]; audio files are often tens of megabytes.
+const HASH_BUF_SIZE: usize = 1 << 20;
+
 /// Compute SHA-256 hash of a file's contents.
 ///
 /// Returns a 64-character hex string.
 pub fn file_hash(path: &Path) -> Result<String> {
     let mut hasher = Sha256::new();
-    let mut file = std::fs::File::open(path)
+    let file = std::fs::File::open(path)
         .with_context(|| format!("Failed to open file for hashing: {}", path.display()))?;
-    std::io::copy(&mut file, &mut hasher)?;
+    // io::copy feeds the hasher straight from a BufReader's buffer, so this
+    // reads in 1 MiB chunks instead of its default 8 KiB stack buffer
+    let mut reader = BufReader::with_capacity(HASH_BUF_SIZE, file);
+    std::io::copy(&mut reader, &mut hasher)?;
     let result = hasher.finalize();
     Ok(format!("{:x}", result))
 }
@@ -45,12 +52,23 @@ fn atomic_write(target: &Path, data: &[u8]) -> Result<()> {
     Ok(())
 }
 
+/// Read and deserialize a cached JSON file, or None if missing or invalid.
+///
+/// Parses the raw bytes directly; serde_json validates UTF-8 as it goes, so
+/// a separate read_to_string pass is not needed. A missing file is just a
+/// failed read, so there is no separate exists() check.
+fn read_json<T: serde::de::DeserializeOwned>(path: &Path) -> Option<T> {
+    let data = std::fs::read(path).ok()?;
+    serde_json::from_slice(&data).ok()
+}
+
 // --- Audio extraction cache ---
 
 /// Return cached extracted audio path, or None if not cached.
 pub fn get_cached_audio(input_hash: &str) -> Option<PathBuf> {
     let path = cache_dir().join("extract").join(format!("{}.wav", input_hash));
-    if path.exists() && path.metadata().map(|m| m.len() > 0).unwrap_or(false) {
+    // metadata() fails for a missing file, so one stat covers both checks
+    if path.metadata().map(|m| m.len() > 0).unwrap_or(false) {
         log::info!("Cache hit: audio extraction ({}...)", &input_hash[..12.min(input_hash.len())]);
         Some(path)
     } else {
@@ -58,13 +76,19 @@ pub fn get_cached_audio(input_hash: &str) -> Option<PathBuf> {
     }
 }
 
-/// Copy extracted audio into cache. Returns the cache path.
+/// Store extracted audio in the cache. Returns the cache path.
+///
+/// Hard-links the file when the cache is on the same filesystem, so the
+/// audio is not rewritten; the source must not be modified in place after.
+/// Falls back to a copy across filesystems or if the entry already exists.
 pub fn store_audio_cache(input_hash: &str, audio_path: &Path) -> Result<PathBuf> {
     let dest = cache_dir().join("extract").join(format!("{}.wav", input_hash));
     if let Some(parent) = dest.parent() {
         std::fs::create_dir_all(parent)?;
     }
-    std::fs::copy(audio_path, &dest)?;
+    if std::fs::hard_link(audio_path, &dest).is_err() {
+        std::fs::copy(audio_path, &dest)?;
+    }
     log::info!("Cached audio extraction ({}...)", &input_hash[..12.min(input_hash.len())]);
     Ok(dest)
 }
@@ -80,11 +104,7 @@ pub fn get_cached_transcription(
     let path = cache_dir()
         .join("whisper")
         .join(format!("{}_{}_{}.json", audio_hash, model, language));
-    if !path.exists() {
-        return None;
-    }
-    let data = std::fs::read_to_string(&path).ok()?;
-    let result: TranscriptionResult = serde_json::from_str(&data).ok()?;
+    let result: TranscriptionResult = read_json(&path)?;
     log::info!("Cache hit: transcription ({}...)", &audio_hash[..12.min(audio_hash.len())]);
     Some(result)
 }
@@ -99,8 +119,7 @@ pub fn store_transcription_cache(
     let path = cache_dir()
         .join("whisper")
         .join(format!("{}_{}_{}.json", audio_hash, model, language));
-    let json = serde_json::to_string(result)?;
-    atomic_write(&path, json.as_bytes())?;
+    atomic_write(&path, &serde_json::to_vec(result)?)?;
     log::info!("Cached transcription ({}...)", &audio_hash[..12.min(audio_hash.len())]);
     Ok(())
 }
@@ -122,11 +141,7 @@ pub fn get_cached_alignment(
     let path = cache_dir()
         .join("align")
         .join(format!("{}.json", parts.join("_")));
-    if !path.exists() {
-        return None;
-    }
-    let data = std::fs::read_to_string(&path).ok()?;
-    let result: AlignmentResult = serde_json::from_str(&data).ok()?;
+    let result: AlignmentResult = read_json(&path)?;
     log::info!("Cache hit: alignment ({}...)", &audio_hash[..12.min(audio_hash.len())]);
     Some(result)
 }
@@ -147,8 +162,7 @@ pub fn store_alignment_cache(
     let path = cache_dir()
         .join("align")
         .join(format!("{}.json", parts.join("_")));
-    let json = serde_json::to_string(result)?;
-    atomic_write(&path, json.as_bytes())?;
+    atomic_write(&path, &serde_json::to_vec(result)?)?;
     log::info!("Cached alignment ({}...)", &audio_hash[..12.min(audio_hash.len())]);
     Ok(())
 }
@@ -173,6 +187,21 @@ mod tests {
         std::fs::remove_dir_all(&dir).ok();
     }
 
+    #[test]
+    fn test_file_hash_known_digest() {
+        let dir = std::env::temp_dir().join(format!("glottisdale_hash_known_{}", std::process::id()));
+        std::fs::create_dir_all(&dir).unwrap();
+        let path = dir.join("test.txt");
+        std::fs::write(&path, b"abc").unwrap();
+
+        assert_eq!(
+            file_hash(&path).unwrap(),
+            "ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad"
+        );
+
+        std::fs::remove_dir_all(&dir).ok();
+    }
+
     #[test]
     fn test_file_hash_different_content() {
         let dir = std::env::temp_dir().join(format!("glottisdale_hash_diff_{}", std::process::id()));
@@ -252,6 +281,23 @@ mod tests {
         assert_eq!(deserialized.syllables[0].phonemes[0].label, "T");
     }
 
+    #[test]
+    fn test_read_json() {
+        let dir = std::env::temp_dir().join(format!("glottisdale_read_json_{}", std::process::id()));
+        std::fs::create_dir_all(&dir).unwrap();
+        let good = dir.join("good.json");
+        let bad = dir.join("bad.json");
+        std::fs::write(&good, br#"{"text": "hi", "words": [], "language": "en"}"#).unwrap();
+        std::fs::write(&bad, b"not json").unwrap();
+
+        let result: Option<TranscriptionResult> = read_json(&good);
+        assert_eq!(result.unwrap().text, "hi");
+        assert!(read_json::<TranscriptionResult>(&bad).is_none());
+        assert!(read_json::<TranscriptionResult>(&dir.join("missing.json")).is_none());
+
+        std::fs::remove_dir_all(&dir).ok();
+    }
+
     #[test]
     fn test_audio_store_and_retrieve() {
         let dir = std::env::temp_dir().join(format!("glottisdale_audio_cache_{}", std::process::id()));
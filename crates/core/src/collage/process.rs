@@ -1,6 +1,7 @@
 //! Glottisdale collage pipeline — syllable-level audio collage engine.
 
 use std::collections::HashMap;
+use std::io::{BufWriter, Write};
 use std::path::Path;
 
 use anyhow::{Result, bail};
@@ -13,10 +14,10 @@ use crate::audio::analysis::{
     compute_rms, estimate_f0, find_breaths, find_room_tone, generate_pink_noise,
 };
 use crate::audio::effects::{
-    adjust_volume, concatenate, cut_clip, generate_silence, mix_audio,
-    pitch_shift, time_stretch,
+    concatenate, cut_clip, generate_silence, mix_audio, normalize_pitch_clips,
+    normalize_volume_clips, time_stretch,
 };
-use crate::audio::io::{read_wav, write_wav};
+use crate::audio::io::write_wav;
 use crate::collage::stretch::{
     StretchConfig, apply_stutter, apply_word_repeat, parse_count_range,
     resolve_stretch_factor, should_stretch_syllable,
@@ -310,6 +311,38 @@ fn are_source_sequential(a: &Syllable, b: &Syllable, gap: f64) -> bool {
     ab_gap < gap || ba_gap < gap
 }
 
+/// Check whether a syllable is usable collage material.
+///
+/// Rejects syllables outside a reasonable duration range and, when the
+/// source audio is available, ones with too little energy or a non-speech
+/// pitch.
+fn is_usable_syllable(syl: &Syllable, audio: Option<&(Vec<f64>, u32)>) -> bool {
+    let dur = syl.end - syl.start;
+    // Reject syllables outside reasonable duration range
+    if dur < 0.05 || dur > 0.8 {
+        return false;
+    }
+    // Reject syllables with too little energy or non-speech pitch
+    if let Some((samples, sample_rate)) = audio {
+        let start_idx = (syl.start * *sample_rate as f64) as usize;
+        let end_idx = (syl.end * *sample_rate as f64) as usize;
+        if start_idx < end_idx && end_idx <= samples.len() {
+            let clip = &samples[start_idx..end_idx];
+            let rms = compute_rms(clip);
+            if rms < 0.005 {
+                return false;
+            }
+            // Reject clips with very low F0 (rumble, bass, non-speech)
+            if let Some(f0) = estimate_f0(clip, *sample_rate, 80, 600) {
+                if f0 < 100.0 {
+                    return false;
+                }
+            }
+        }
+    }
+    true
+}
+
 /// Configuration for the collage pipeline.
 #[derive(Debug, Clone)]
 pub struct CollageConfig {
@@ -379,78 +412,6 @@ impl Default for CollageConfig {
     }
 }
 
-/// Normalize volume across clips to median RMS (in-memory).
-fn normalize_volume_clips(clips: &mut [Vec<f64>]) {
-    let rms_values: Vec<f64> = clips
-        .iter()
-        .map(|c| compute_rms(c))
-        .filter(|&r| r > 1e-6)
-        .collect();
-
-    if rms_values.is_empty() {
-        return;
-    }
-
-    let mut sorted = rms_values.clone();
-    sorted.sort_by(|a, b| a.partial_cmp(b).unwrap());
-    let target_rms = sorted[sorted.len() / 2];
-
-    if target_rms < 1e-6 {
-        return;
-    }
-
-    for clip in clips.iter_mut() {
-        let clip_rms = compute_rms(clip);
-        if clip_rms < 1e-6 {
-            continue;
-        }
-        let db_adjust = 20.0 * (target_rms / clip_rms).log10();
-        let db_adjust = db_adjust.clamp(-20.0, 20.0);
-        if db_adjust.abs() >= 0.5 {
-            adjust_volume(clip, db_adjust);
-        }
-    }
-}
-
-/// Minimum F0 target for pitch normalization (Hz).
-/// Prevents the median from settling too low when source material is bass-heavy.
-const MIN_PITCH_TARGET_HZ: f64 = 160.0;
-
-/// Normalize pitch across clips toward median F0 (in-memory).
-fn normalize_pitch_clips(clips: &mut [Vec<f64>], sr: u32, pitch_range: f64) {
-    let f0_values: Vec<(usize, f64)> = clips
-        .iter()
-        .enumerate()
-        .filter_map(|(i, c)| estimate_f0(c, sr, 80, 600).map(|f0| (i, f0)))
-        .collect();
-
-    if f0_values.is_empty() {
-        return;
-    }
-
-    let mut sorted_f0s: Vec<f64> = f0_values.iter().map(|(_, f0)| *f0).collect();
-    sorted_f0s.sort_by(|a, b| a.partial_cmp(b).unwrap());
-    let median_f0 = sorted_f0s[sorted_f0s.len() / 2];
-    let target_f0 = median_f0.max(MIN_PITCH_TARGET_HZ);
-
-    log::info!(
-        "Pitch normalization: median F0 = {:.1}Hz, target F0 = {:.1}Hz (from {} voiced clips)",
-        median_f0,
-        target_f0,
-        f0_values.len()
-    );
-
-    for (i, f0) in &f0_values {
-        let semitones_shift = 12.0 * (target_f0 / f0).log2();
-        let semitones_shift = semitones_shift.clamp(-pitch_range, pitch_range);
-        if semitones_shift.abs() >= 0.1 {
-            if let Ok(shifted) = pitch_shift(&clips[*i], sr, semitones_shift) {
-                clips[*i] = shifted;
-            }
-        }
-    }
-}
-
 /// Apply prosodic dynamics to a clip: slight boost at start, taper at end.
 pub fn apply_prosodic_dynamics(samples: &mut [f64], sr: u32) {
     let len = samples.len();
@@ -579,39 +540,31 @@ pub fn process(
     }
 
     // --- Filter syllables: reject too-long, too-short, and non-speech ---
+    // The energy and F0 checks are independent per syllable, so each
+    // source's syllables are split into chunks filtered on separate threads.
+    let threads = std::thread::available_parallelism().map_or(1, |n| n.get());
     let mut filtered_sources: HashMap<String, Vec<Syllable>> = HashMap::new();
     for (name, syls) in source_syllables {
         let audio = source_audio.get(name);
-        let filtered: Vec<Syllable> = syls
-            .iter()
-            .filter(|syl| {
-                let dur = syl.end - syl.start;
-                // Reject syllables outside reasonable duration range
-                if dur < 0.05 || dur > 0.8 {
-                    return false;
-                }
-                // Reject syllables with too little energy or non-speech pitch
-                if let Some((samples, sample_rate)) = audio {
-                    let start_idx = (syl.start * *sample_rate as f64) as usize;
-                    let end_idx = (syl.end * *sample_rate as f64) as usize;
-                    if start_idx < end_idx && end_idx <= samples.len() {
-                        let clip = &samples[start_idx..end_idx];
-                        let rms = compute_rms(clip);
-                        if rms < 0.005 {
-                            return false;
-                        }
-                        // Reject clips with very low F0 (rumble, bass, non-speech)
-                        if let Some(f0) = estimate_f0(clip, *sample_rate, 80, 600) {
-                            if f0 < 100.0 {
-                                return false;
-                            }
-                        }
-                    }
-                }
-                true
-            })
-            .cloned()
-            .collect();
+        let chunk_len = syls.len().div_ceil(threads).max(1);
+        let filtered: Vec<Syllable> = std::thread::scope(|scope| {
+            let handles: Vec<_> = syls
+                .chunks(chunk_len)
+                .map(|chunk| {
+                    scope.spawn(move || {
+                        chunk
+                            .iter()
+                            .filter(|syl| is_usable_syllable(syl, audio))
+                            .cloned()
+                            .collect::<Vec<_>>()
+                    })
+                })
+                .collect();
+            handles
+                .into_iter()
+                .flat_map(|h| h.join().expect("syllable filter thread panicked"))
+                .collect()
+        });
         if !filtered.is_empty() {
             filtered_sources.insert(name.clone(), filtered);
         }
@@ -641,33 +594,40 @@ pub fn process(
         )
     };
 
-    // Helper: find which source a syllable came from
-    let find_source = |syl: &Syllable| -> String {
-        for (name, syls) in source_syllables {
-            if syls.iter().any(|s| std::ptr::eq(s, syl) || (s.start == syl.start && s.end == syl.end && s.word == syl.word && s.word_index == syl.word_index)) {
-                return name.clone();
-            }
+    // Helper: find which source a syllable came from. Index every source
+    // syllable by its timing once so lookups don't rescan all sources.
+    let mut source_index: HashMap<_, Vec<(&str, &str)>> = HashMap::new();
+    for (name, syls) in source_syllables {
+        for s in syls {
+            source_index
+                .entry((s.start.to_bits(), s.end.to_bits(), s.word_index))
+                .or_default()
+                .push((s.word.as_str(), name.as_str()));
         }
-        "unknown".to_string()
+    }
+    let find_source = |syl: &Syllable| {
+        source_index
+            .get(&(syl.start.to_bits(), syl.end.to_bits(), syl.word_index))
+            .and_then(|candidates| candidates.iter().find(|(word, _)| *word == syl.word))
+            .map_or("unknown", |(_, name)| *name)
     };
 
     // --- Group syllables into words ---
     let words = group_into_words(&selected, spc_min, spc_max, &mut rng);
 
-    // --- Cut all syllable clips ---
+    // --- Cut all syllable clips, grouped by word ---
     struct SylClipInfo {
-        word_idx: usize,
         syl_idx: usize,
         samples: Vec<f64>,
-        syl: Syllable,
     }
 
-    let mut all_syl_clips: Vec<SylClipInfo> = Vec::new();
+    let mut word_syl_clips: Vec<Vec<SylClipInfo>> = Vec::with_capacity(words.len());
 
-    for (word_idx, word_syls) in words.iter().enumerate() {
+    for word_syls in &words {
+        let mut word_clips = Vec::new();
         for (syl_idx, syl) in word_syls.iter().enumerate() {
             let syl_source = find_source(syl);
-            if let Some((source_samples, source_sr)) = source_audio.get(&syl_source) {
+            if let Some((source_samples, source_sr)) = source_audio.get(syl_source) {
                 let clip = cut_clip(
                     source_samples,
                     *source_sr,
@@ -677,67 +637,57 @@ pub fn process(
                     0.0,
                 );
                 if !clip.is_empty() {
-                    all_syl_clips.push(SylClipInfo {
-                        word_idx,
+                    word_clips.push(SylClipInfo {
                         syl_idx,
                         samples: clip,
-                        syl: syl.clone(),
                     });
                 }
             }
         }
+        word_syl_clips.push(word_clips);
     }
 
     // --- Pitch normalization ---
-    if config.pitch_normalize && !all_syl_clips.is_empty() {
-        let mut clip_samples: Vec<Vec<f64>> =
-            all_syl_clips.iter().map(|c| c.samples.clone()).collect();
+    if config.pitch_normalize {
+        let mut clip_samples: Vec<Vec<f64>> = word_syl_clips
+            .iter_mut()
+            .flatten()
+            .map(|c| std::mem::take(&mut c.samples))
+            .collect();
         normalize_pitch_clips(&mut clip_samples, sr, config.pitch_range);
-        for (i, samples) in clip_samples.into_iter().enumerate() {
-            all_syl_clips[i].samples = samples;
+        for (clip, samples) in word_syl_clips.iter_mut().flatten().zip(clip_samples) {
+            clip.samples = samples;
         }
     }
 
     // --- Volume normalization ---
-    if config.volume_normalize && !all_syl_clips.is_empty() {
-        let mut clip_samples: Vec<Vec<f64>> =
-            all_syl_clips.iter().map(|c| c.samples.clone()).collect();
+    if config.volume_normalize {
+        let mut clip_samples: Vec<Vec<f64>> = word_syl_clips
+            .iter_mut()
+            .flatten()
+            .map(|c| std::mem::take(&mut c.samples))
+            .collect();
         normalize_volume_clips(&mut clip_samples);
-        for (i, samples) in clip_samples.into_iter().enumerate() {
-            all_syl_clips[i].samples = samples;
+        for (clip, samples) in word_syl_clips.iter_mut().flatten().zip(clip_samples) {
+            clip.samples = samples;
         }
     }
 
     // --- Stutter ---
     if let Some(stutter_prob) = config.stutter {
         if let Some(count_range) = stutter_count_range {
-            for word_idx in 0..words.len() {
-                let word_clips: Vec<usize> = all_syl_clips
-                    .iter()
-                    .enumerate()
-                    .filter(|(_, c)| c.word_idx == word_idx)
-                    .map(|(i, _)| i)
-                    .collect();
-
+            for word_clips in word_syl_clips.iter_mut() {
                 if !word_clips.is_empty() {
-                    let clip_refs: Vec<Vec<f64>> =
-                        word_clips.iter().map(|&i| all_syl_clips[i].samples.clone()).collect();
-                    let stuttered = apply_stutter(&clip_refs, stutter_prob, count_range, &mut rng);
-                    // Update the clips - remove old word entries and add stuttered ones
-                    let syl = all_syl_clips[word_clips[0]].syl.clone();
-                    // Remove old entries for this word (in reverse order to maintain indices)
-                    for &i in word_clips.iter().rev() {
-                        all_syl_clips.remove(i);
-                    }
-                    // Add stuttered entries
-                    for (syl_idx, samples) in stuttered.into_iter().enumerate() {
-                        all_syl_clips.push(SylClipInfo {
-                            word_idx,
-                            syl_idx,
-                            samples,
-                            syl: syl.clone(),
-                        });
-                    }
+                    let samples: Vec<Vec<f64>> = word_clips
+                        .iter_mut()
+                        .map(|c| std::mem::take(&mut c.samples))
+                        .collect();
+                    let stuttered = apply_stutter(&samples, stutter_prob, count_range, &mut rng);
+                    *word_clips = stuttered
+                        .into_iter()
+                        .enumerate()
+                        .map(|(syl_idx, samples)| SylClipInfo { syl_idx, samples })
+                        .collect();
                 }
             }
         }
@@ -746,31 +696,24 @@ pub fn process(
     // --- Syllable stretch ---
     if config.stretch_config.has_syllable_stretch() {
         let mut global_syl_idx = 0usize;
-        for word_idx in 0..words.len() {
-            let word_clips: Vec<usize> = all_syl_clips
-                .iter()
-                .enumerate()
-                .filter(|(_, c)| c.word_idx == word_idx)
-                .map(|(i, _)| i)
-                .collect();
-
-            for &i in &word_clips {
-                let clip_dur = all_syl_clips[i].samples.len() as f64 / sr as f64;
-                if clip_dur >= 0.08 {
-                    let syl_idx = all_syl_clips[i].syl_idx;
-                    if should_stretch_syllable(
+        for word_clips in word_syl_clips.iter_mut() {
+            let word_len = word_clips.len();
+            for clip in word_clips.iter_mut() {
+                let clip_dur = clip.samples.len() as f64 / sr as f64;
+                if clip_dur >= 0.08
+                    && should_stretch_syllable(
                         global_syl_idx,
-                        syl_idx,
-                        word_clips.len(),
+                        clip.syl_idx,
+                        word_len,
                         &mut rng,
                         &config.stretch_config,
-                    ) {
-                        let factor = resolve_stretch_factor(
-                            config.stretch_config.stretch_factor,
-                            &mut rng,
-                        );
-                        all_syl_clips[i].samples = time_stretch(&all_syl_clips[i].samples, sr, factor)?;
-                    }
+                    )
+                {
+                    let factor = resolve_stretch_factor(
+                        config.stretch_config.stretch_factor,
+                        &mut rng,
+                    );
+                    clip.samples = time_stretch(&clip.samples, sr, factor)?;
                 }
                 global_syl_idx += 1;
             }
@@ -782,22 +725,17 @@ pub fn process(
     let mut clips: Vec<Clip> = Vec::new();
     let mut word_audio: Vec<Vec<f64>> = Vec::new();
 
-    for (word_idx, word_syls) in words.iter().enumerate() {
-        let syl_clips: Vec<&Vec<f64>> = all_syl_clips
-            .iter()
-            .filter(|c| c.word_idx == word_idx)
-            .map(|c| &c.samples)
-            .collect();
+    for (word_idx, (word_syls, word_clips)) in words.iter().zip(word_syl_clips).enumerate() {
+        let mut syl_clips: Vec<Vec<f64>> = word_clips.into_iter().map(|c| c.samples).collect();
 
         if syl_clips.is_empty() {
             continue;
         }
 
         let word_samples = if syl_clips.len() == 1 {
-            syl_clips[0].clone()
+            syl_clips.pop().unwrap()
         } else {
-            let owned: Vec<Vec<f64>> = syl_clips.iter().map(|c| c.to_vec()).collect();
-            concatenate(&owned, crossfade_samples)
+            concatenate(&syl_clips, crossfade_samples)
         };
 
         // Write word clip to clips_dir
@@ -806,11 +744,15 @@ pub fn process(
         write_wav(&word_output, &word_samples, sr)?;
 
         // Determine dominant source
-        let word_sources: Vec<String> = word_syls.iter().map(&find_source).collect();
+        let word_sources: Vec<&str> = word_syls.iter().map(&find_source).collect();
+        let mut source_counts: HashMap<&str, usize> = HashMap::new();
+        for &source in &word_sources {
+            *source_counts.entry(source).or_default() += 1;
+        }
         let dominant = word_sources
             .iter()
-            .max_by_key(|s| word_sources.iter().filter(|t| *t == *s).count())
-            .cloned()
+            .max_by_key(|s| source_counts[*s])
+            .map(|s| s.to_string())
             .unwrap_or_else(|| "unknown".to_string());
 
         clips.push(Clip {
@@ -838,6 +780,14 @@ pub fn process(
         }
     }
 
+    // Word repeat clones clips, so map each word file back to its audio
+    // to assemble phrases from memory instead of re-reading the WAVs.
+    let word_audio_index: HashMap<std::path::PathBuf, usize> = clips
+        .iter()
+        .enumerate()
+        .map(|(i, c)| (c.output_path.clone(), i))
+        .collect();
+
     // --- Word repeat ---
     if let Some(repeat_prob) = config.repeat_weight {
         if let Some(count_range) = repeat_count_range {
@@ -851,15 +801,12 @@ pub fn process(
 
     let mut phrase_audio: Vec<Vec<f64>> = Vec::new();
     for phrase_clips in &phrase_groups {
-        // Load word audio for each clip in phrase
-        let mut phrase_word_samples: Vec<Vec<f64>> = Vec::new();
-        for clip in phrase_clips {
-            if clip.output_path.exists() {
-                if let Ok((samples, _)) = read_wav(&clip.output_path) {
-                    phrase_word_samples.push(samples);
-                }
-            }
-        }
+        // Look up word audio for each clip in phrase
+        let phrase_word_samples: Vec<Vec<f64>> = phrase_clips
+            .iter()
+            .filter_map(|clip| word_audio_index.get(&clip.output_path))
+            .map(|&i| word_audio[i].clone())
+            .collect();
 
         if phrase_word_samples.is_empty() {
             continue;
@@ -993,8 +940,11 @@ pub fn process(
         }).collect::<Vec<_>>(),
     });
 
+    // Stream the manifest to disk rather than rendering it to a String first
     let manifest_path = output_dir.join("manifest.json");
-    std::fs::write(&manifest_path, serde_json::to_string_pretty(&manifest)?)?;
+    let mut manifest_file = BufWriter::new(std::fs::File::create(&manifest_path)?);
+    serde_json::to_writer_pretty(&mut manifest_file, &manifest)?;
+    manifest_file.flush()?;
 
     Ok(PipelineResult {
         clips,
@@ -1012,6 +962,19 @@ pub fn process(
 mod tests {
     use super::*;
 
+    /// `n` back-to-back 0.3s syllables, one per word.
+    fn make_syllables(n: usize) -> Vec<Syllable> {
+        (0..n)
+            .map(|i| Syllable {
+                phonemes: vec![],
+                start: i as f64 * 0.3,
+                end: i as f64 * 0.3 + 0.3,
+                word: format!("w{}", i),
+                word_index: i,
+            })
+            .collect()
+    }
+
     #[test]
     fn test_parse_range() {
         assert_eq!(parse_range("1-5"), (1, 5));
@@ -1027,10 +990,16 @@ mod tests {
     #[test]
     fn test_weighted_word_length() {
         let mut rng = StdRng::seed_from_u64(42);
-        for _ in 0..100 {
+        // One batch of draws checks both the bounds and the weighting
+        let mut counts = [0usize; 5];
+        for _ in 0..1000 {
             let len = weighted_word_length(1, 4, &mut rng);
-            assert!(len >= 1 && len <= 4);
+            assert!((1..=4).contains(&len));
+            counts[len] += 1;
         }
+        // Two-syllable words carry the heaviest weight
+        assert!(counts[2] > counts[1]);
+        assert!(counts[2] > counts[4]);
     }
 
     #[test]
@@ -1042,15 +1011,7 @@ mod tests {
     #[test]
     fn test_sample_syllables_basic() {
         let mut rng = StdRng::seed_from_u64(42);
-        let syls: Vec<Syllable> = (0..10)
-            .map(|i| Syllable {
-                phonemes: vec![],
-                start: i as f64 * 0.3,
-                end: i as f64 * 0.3 + 0.3,
-                word: format!("w{}", i),
-                word_index: i,
-            })
-            .collect();
+        let syls = make_syllables(10);
         let selected = sample_syllables(&syls, 1.0, 1.0, &mut rng);
         assert!(!selected.is_empty());
         let total_dur: f64 = selected.iter().map(|s| s.end - s.start).sum();
@@ -1060,15 +1021,7 @@ mod tests {
     #[test]
     fn test_group_into_words() {
         let mut rng = StdRng::seed_from_u64(42);
-        let syls: Vec<Syllable> = (0..10)
-            .map(|i| Syllable {
-                phonemes: vec![],
-                start: i as f64 * 0.3,
-                end: i as f64 * 0.3 + 0.3,
-                word: format!("w{}", i),
-                word_index: i,
-            })
-            .collect();
+        let syls = make_syllables(10);
         let words = group_into_words(&syls, 1, 3, &mut rng);
         assert!(!words.is_empty());
         let total: usize = words.iter().map(|w| w.len()).sum();
@@ -1102,6 +1055,44 @@ mod tests {
         assert!(samples[fade_start] < original[fade_start]);
     }
 
+    #[test]
+    fn test_process_phrase_grouping() {
+        let sr = 16000u32;
+        // A steady 220Hz tone passes the energy and pitch filters
+        let n = (6.5 * sr as f64) as usize;
+        let samples: Vec<f64> = (0..n)
+            .map(|i| 0.3 * (2.0 * std::f64::consts::PI * 220.0 * i as f64 / sr as f64).sin())
+            .collect();
+        let source_audio = HashMap::from([("a.wav".to_string(), (samples, sr))]);
+        let source_syllables = HashMap::from([("a.wav".to_string(), make_syllables(20))]);
+
+        let dir = std::env::temp_dir()
+            .join(format!("glottisdale_collage_test_{}", std::process::id()));
+        let config = CollageConfig {
+            syllables_per_clip: "1".to_string(),
+            words_per_phrase: "2-3".to_string(),
+            seed: Some(42),
+            noise_level_db: 0.0,
+            room_tone: false,
+            pitch_normalize: false,
+            breaths: false,
+            volume_normalize: false,
+            ..Default::default()
+        };
+        let result = process(&source_audio, &source_syllables, &dir, &config).unwrap();
+
+        // Every syllable fits the target duration and becomes its own word
+        assert_eq!(result.clips.len(), 20);
+        assert!(result.clips.iter().all(|c| c.syllables.len() == 1));
+        assert!(result.concatenated.exists());
+        assert_eq!(result.manifest["clips"].as_array().unwrap().len(), 20);
+        let on_disk: serde_json::Value =
+            serde_json::from_slice(&std::fs::read(dir.join("manifest.json")).unwrap()).unwrap();
+        assert_eq!(on_disk, result.manifest);
+
+        std::fs::remove_dir_all(&dir).ok();
+    }
+
     #[test]
     fn test_collage_config_default() {
         let config = CollageConfig::default();
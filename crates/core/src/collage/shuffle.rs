@@ -5,6 +5,7 @@
 //! Produces gibberish that preserves natural speech rhythm and coarticulation.
 
 use std::collections::{HashMap, HashSet};
+use std::io::{BufWriter, Write};
 use std::path::Path;
 
 use anyhow::{Result, bail};
@@ -16,8 +17,8 @@ use crate::audio::analysis::{compute_rms, estimate_f0};
 use crate::audio::effects::{concatenate, cut_clip, time_stretch};
 use crate::audio::io::write_wav;
 use crate::speak::matcher::MatchResult;
-use crate::speak::phonetic_distance::{normalize_phoneme, syllable_distance};
-use crate::speak::syllable_bank::{SyllableEntry, build_bank};
+use crate::speak::phonetic_distance::{syllable_code_distance, PhonemeEncoder};
+use crate::speak::syllable_bank::{SyllableEntry, build_bank, syllable_labels};
 use crate::types::{PipelineResult, Syllable};
 
 /// Number of top candidates to consider when randomly picking a match.
@@ -118,31 +119,18 @@ pub fn process_shuffle(
             continue;
         }
 
-        // Filter template to syllables with real phonemes
-        let filtered_template: Vec<&Syllable> = template_syls
-            .iter()
-            .filter(|syl| {
-                syl.phonemes
-                    .iter()
-                    .any(|p| !p.label.is_empty() && p.label.chars().next().map(|c| c.is_alphabetic()).unwrap_or(false))
-            })
-            .collect();
+        // Keep template syllables with real phonemes, normalizing each once
+        let (filtered_template, target_phonemes): (Vec<&Syllable>, Vec<Vec<String>>) =
+            template_syls
+                .iter()
+                .map(|syl| (syl, syllable_labels(syl)))
+                .filter(|(_, labels)| !labels.is_empty())
+                .unzip();
 
         if filtered_template.is_empty() {
             continue;
         }
 
-        let target_phonemes: Vec<Vec<String>> = filtered_template
-            .iter()
-            .map(|syl| {
-                syl.phonemes
-                    .iter()
-                    .filter(|p| !p.label.is_empty() && p.label.chars().next().map(|c| c.is_alphabetic()).unwrap_or(false))
-                    .map(|p| normalize_phoneme(&p.label))
-                    .collect()
-            })
-            .collect();
-
         // Build bank from all sources EXCEPT the template
         let mut bank: Vec<SyllableEntry> = Vec::new();
         for (name, syls) in &filtered_sources {
@@ -156,6 +144,12 @@ pub fn process_shuffle(
             continue;
         }
 
+        // Intern each bank syllable's phonemes once; every target is scored
+        // against the whole bank
+        let mut encoder = PhonemeEncoder::new();
+        let bank_codes =
+            encoder.encode_all(bank.iter().map(|entry| entry.phoneme_labels.as_slice()));
+
         // Randomized top-N matching with reuse prevention
         let mut used: HashSet<usize> = HashSet::new();
         let matches: Vec<(MatchResult, f64)> = target_phonemes
@@ -163,12 +157,13 @@ pub fn process_shuffle(
             .enumerate()
             .map(|(target_idx, target)| {
                 let template_dur = filtered_template[target_idx].end - filtered_template[target_idx].start;
+                let target_codes = encoder.encode(target);
 
-                let mut scored: Vec<(usize, i32)> = bank
+                let mut scored: Vec<(usize, i32)> = bank_codes
                     .iter()
                     .enumerate()
-                    .map(|(j, entry)| {
-                        let dist = syllable_distance(target, &entry.phoneme_labels);
+                    .map(|(j, codes)| {
+                        let dist = syllable_code_distance(&target_codes, codes);
                         let reuse_penalty = if used.contains(&j) { 20 } else { 0 };
                         (j, dist + reuse_penalty)
                     })
@@ -275,8 +270,11 @@ pub fn process_shuffle(
         "duration": output_duration,
     });
 
+    // Stream the manifest to disk rather than rendering it to a String first
     let manifest_path = output_dir.join("manifest.json");
-    std::fs::write(&manifest_path, serde_json::to_string_pretty(&manifest)?)?;
+    let mut manifest_file = BufWriter::new(std::fs::File::create(&manifest_path)?);
+    serde_json::to_writer_pretty(&mut manifest_file, &manifest)?;
+    manifest_file.flush()?;
 
     println!("Selected {} clips", total_matched);
 
@@ -162,6 +162,11 @@ mod tests {
     use super::*;
     use rand::SeedableRng;
 
+    /// Fixed-seed RNG shared by the probabilistic tests.
+    fn seeded_rng() -> StdRng {
+        StdRng::seed_from_u64(42)
+    }
+
     #[test]
     fn test_parse_stretch_factor_fixed() {
         assert_eq!(parse_stretch_factor("2.0"), (2.0, 2.0));
@@ -181,55 +186,141 @@ mod tests {
 
     #[test]
     fn test_resolve_stretch_factor_fixed() {
-        let mut rng = StdRng::seed_from_u64(42);
+        let mut rng = seeded_rng();
         assert_eq!(resolve_stretch_factor((2.0, 2.0), &mut rng), 2.0);
     }
 
     #[test]
     fn test_resolve_stretch_factor_range() {
-        let mut rng = StdRng::seed_from_u64(42);
+        let mut rng = seeded_rng();
         let f = resolve_stretch_factor((1.0, 3.0), &mut rng);
         assert!(f >= 1.0 && f <= 3.0);
     }
 
     #[test]
-    fn test_should_stretch_alternating() {
-        let config = StretchConfig {
+    fn test_should_stretch_syllable_modes() {
+        let alternating = StretchConfig {
             alternating_stretch: Some(2),
             ..Default::default()
         };
-        let mut rng = StdRng::seed_from_u64(42);
-        assert!(should_stretch_syllable(0, 0, 4, &mut rng, &config));
-        assert!(!should_stretch_syllable(1, 1, 4, &mut rng, &config));
-        assert!(should_stretch_syllable(2, 2, 4, &mut rng, &config));
-    }
-
-    #[test]
-    fn test_should_stretch_boundary() {
-        let config = StretchConfig {
+        let boundary = StretchConfig {
             boundary_stretch: Some(1),
             ..Default::default()
         };
-        let mut rng = StdRng::seed_from_u64(42);
-        assert!(should_stretch_syllable(0, 0, 3, &mut rng, &config)); // first
-        assert!(!should_stretch_syllable(1, 1, 3, &mut rng, &config)); // middle
-        assert!(should_stretch_syllable(2, 2, 3, &mut rng, &config)); // last
+        let always = StretchConfig {
+            random_stretch: Some(1.0),
+            ..Default::default()
+        };
+        let never = StretchConfig {
+            random_stretch: Some(0.0),
+            ..Default::default()
+        };
+        // (config, syllable_index, word_syllable_index, word_syllable_count, expected)
+        let cases = [
+            (&alternating, 0, 0, 4, true),
+            (&alternating, 1, 1, 4, false),
+            (&alternating, 2, 2, 4, true),
+            (&boundary, 0, 0, 3, true),  // first
+            (&boundary, 1, 1, 3, false), // middle
+            (&boundary, 2, 2, 3, true),  // last
+            (&always, 1, 1, 3, true),
+            (&never, 1, 1, 3, false),
+        ];
+        // Only the random mode draws from the RNG, so one instance serves
+        // every case.
+        let mut rng = seeded_rng();
+        for (config, syl_idx, word_syl_idx, word_syl_count, expected) in cases {
+            assert_eq!(
+                should_stretch_syllable(syl_idx, word_syl_idx, word_syl_count, &mut rng, config),
+                expected,
+                "{:?} at {}",
+                config,
+                syl_idx
+            );
+        }
+    }
+
+    #[test]
+    fn test_apply_stutter_cases() {
+        // (probability, count_range, expected output)
+        let cases: &[(f64, (usize, usize), &[i32])] = &[
+            (0.0, (1, 1), &[1, 2, 3]),
+            (0.0, (2, 3), &[1, 2, 3]),
+            (1.0, (1, 1), &[1, 1, 2, 2, 3, 3]),
+            (1.0, (2, 2), &[1, 1, 1, 2, 2, 2, 3, 3, 3]),
+        ];
+        let items = [1, 2, 3];
+        for &(prob, count_range, expected) in cases {
+            let mut rng = seeded_rng();
+            let result = apply_stutter(&items, prob, count_range, &mut rng);
+            assert_eq!(result, expected, "prob={} range={:?}", prob, count_range);
+        }
     }
 
     #[test]
-    fn test_apply_stutter_no_stutter() {
-        let mut rng = StdRng::seed_from_u64(42);
-        let items = vec![1, 2, 3];
-        let result = apply_stutter(&items, 0.0, (1, 1), &mut rng);
-        assert_eq!(result, vec![1, 2, 3]);
+    fn test_apply_stutter_length_bounds() {
+        // Sweep sizes and probabilities over fixed seeds
+        for (seed, &prob) in [0.0, 0.25, 0.5, 1.0].iter().enumerate() {
+            let mut rng = StdRng::seed_from_u64(seed as u64);
+            for n in [1usize, 10, 100] {
+                let items: Vec<usize> = (0..n).collect();
+                let result = apply_stutter(&items, prob, (1, 3), &mut rng);
+                assert!(result.len() >= n && result.len() <= n * 4);
+                // Stutters only repeat the current item, so order is kept
+                let mut deduped = result.clone();
+                deduped.dedup();
+                assert_eq!(deduped, items);
+            }
+        }
+    }
+
+    fn make_clip(i: usize) -> Clip {
+        Clip {
+            syllables: vec![],
+            start: i as f64,
+            end: i as f64 + 0.5,
+            source: "a.wav".to_string(),
+            output_path: format!("{:03}_word.wav", i + 1).into(),
+        }
+    }
+
+    #[test]
+    fn test_apply_word_repeat_length_bounds() {
+        let words: Vec<Clip> = (0..20).map(make_clip).collect();
+        for (seed, &prob) in [0.0, 0.5, 1.0].iter().enumerate() {
+            let mut rng = StdRng::seed_from_u64(seed as u64);
+            let result = apply_word_repeat(&words, prob, (1, 2), "exact", &mut rng);
+            assert!(result.len() >= 20 && result.len() <= 60);
+        }
     }
 
     #[test]
-    fn test_apply_stutter_always() {
-        let mut rng = StdRng::seed_from_u64(42);
-        let items = vec![1, 2];
-        let result = apply_stutter(&items, 1.0, (1, 1), &mut rng);
-        assert!(result.len() > items.len());
+    fn test_apply_word_repeat_cases() {
+        // (probability, count_range, style, expected length)
+        let cases: &[(f64, (usize, usize), &str, usize)] = &[
+            (0.0, (1, 2), "exact", 3),
+            (1.0, (1, 1), "exact", 6),
+            (1.0, (2, 2), "exact", 9),
+            // Only "exact" duplicates; other styles pass words through
+            (1.0, (2, 2), "resample", 3),
+        ];
+        let words: Vec<Clip> = (0..3).map(make_clip).collect();
+        for &(prob, count_range, style, expected_len) in cases {
+            let mut rng = seeded_rng();
+            let result = apply_word_repeat(&words, prob, count_range, style, &mut rng);
+            assert_eq!(
+                result.len(),
+                expected_len,
+                "prob={} range={:?} style={}",
+                prob,
+                count_range,
+                style
+            );
+            // Repeats stay adjacent to the word they copy
+            let mut paths: Vec<_> = result.iter().map(|c| &c.output_path).collect();
+            paths.dedup();
+            assert_eq!(paths.len(), words.len());
+        }
     }
 
     #[test]
@@ -325,7 +325,8 @@ mod tests {
         arr.timeline.push(tc);
         arr.relayout(0.0);
 
-        let dir = std::env::temp_dir().join("glottisdale_test_export");
+        let dir = std::env::temp_dir()
+            .join(format!("glottisdale_test_export_{}", std::process::id()));
         std::fs::create_dir_all(&dir).unwrap();
         let path = dir.join("test_export.wav");
 
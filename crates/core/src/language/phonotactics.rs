@@ -286,6 +286,13 @@ mod tests {
         assert!(score < 0); // NG can't start a syllable
     }
 
+    fn labels(syllables: &[Syllable]) -> Vec<Vec<&str>> {
+        syllables
+            .iter()
+            .map(|s| s.phonemes.iter().map(|p| p.label.as_str()).collect())
+            .collect()
+    }
+
     #[test]
     fn test_order_syllables_deterministic() {
         let syls = vec![
@@ -295,11 +302,9 @@ mod tests {
         ];
         let a = order_syllables(&syls, Some(42), 10);
         let b = order_syllables(&syls, Some(42), 10);
-        // Same seed should give same result
-        assert_eq!(a.len(), b.len());
-        for (sa, sb) in a.iter().zip(b.iter()) {
-            assert_eq!(sa.phonemes.len(), sb.phonemes.len());
-        }
+        // Same seed should give the same order; compare label sequences
+        // rather than whole syllables since every field is cloned.
+        assert_eq!(labels(&a), labels(&b));
     }
 
     #[test]
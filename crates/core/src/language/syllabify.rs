@@ -41,38 +41,31 @@ pub fn syllabify_word(
         }
     };
 
-    // Build phoneme lists per syllable
-    let syl_phoneme_lists: Vec<Vec<&str>> = syl_tuples
+    // Phoneme counts are known up front, so size each syllable's phoneme
+    // list exactly and move the labels straight out of the syllable parts.
+    let total_phonemes: usize = syl_tuples
         .iter()
-        .map(|(onset, nucleus, coda)| {
-            onset
-                .iter()
-                .chain(nucleus.iter())
-                .chain(coda.iter())
-                .map(|s| s.as_str())
-                .collect()
-        })
-        .collect();
-
-    let total_phonemes: usize = syl_phoneme_lists.iter().map(|s| s.len()).sum();
+        .map(|(onset, nucleus, coda)| onset.len() + nucleus.len() + coda.len())
+        .sum();
     let total_phonemes = if total_phonemes == 0 { 1 } else { total_phonemes };
     let word_duration = word_end - word_start;
 
-    let mut syllables = Vec::new();
+    let mut syllables = Vec::with_capacity(syl_tuples.len());
     let mut current_time = word_start;
 
-    for syl_phones in &syl_phoneme_lists {
-        let proportion = syl_phones.len() as f64 / total_phonemes as f64;
+    for (onset, nucleus, coda) in syl_tuples {
+        let n_phones = onset.len() + nucleus.len() + coda.len();
+        let proportion = n_phones as f64 / total_phonemes as f64;
         let syl_duration = word_duration * proportion;
         let syl_end = current_time + syl_duration;
 
-        let mut phoneme_objects = Vec::new();
-        if !syl_phones.is_empty() {
-            let ph_dur = syl_duration / syl_phones.len() as f64;
+        let mut phoneme_objects = Vec::with_capacity(n_phones);
+        if n_phones > 0 {
+            let ph_dur = syl_duration / n_phones as f64;
             let mut ph_time = current_time;
-            for &label in syl_phones {
+            for label in onset.into_iter().chain(nucleus).chain(coda) {
                 phoneme_objects.push(Phoneme {
-                    label: label.to_string(),
+                    label,
                     start: round4(ph_time),
                     end: round4(ph_time + ph_dur),
                 });
@@ -126,12 +119,29 @@ fn round4(v: f64) -> f64 {
 mod tests {
     use super::*;
 
+    fn phones(labels: &[&str]) -> Vec<String> {
+        labels.iter().map(|s| s.to_string()).collect()
+    }
+
+    #[test]
+    fn test_syllabify_word_counts() {
+        let cases: &[(&str, &[&str], usize)] = &[
+            ("cat", &["K", "AE1", "T"], 1),
+            ("camel", &["K", "AE1", "M", "AH0", "L"], 2),
+            ("banana", &["B", "AH0", "N", "AE1", "N", "AH0"], 3),
+            ("a", &["AH0"], 1),
+        ];
+        for &(word, labels, expected) in cases {
+            let result = syllabify_word(&phones(labels), 0.0, 1.0, word, 0);
+            assert_eq!(result.len(), expected, "{}", word);
+            let total: usize = result.iter().map(|s| s.phonemes.len()).sum();
+            assert_eq!(total, labels.len(), "{}", word);
+        }
+    }
+
     #[test]
     fn test_syllabify_word_cat() {
-        let phonemes: Vec<String> = vec!["K", "AE1", "T"]
-            .into_iter()
-            .map(String::from)
-            .collect();
+        let phonemes = phones(&["K", "AE1", "T"]);
         let result = syllabify_word(&phonemes, 0.0, 0.5, "cat", 0);
         assert_eq!(result.len(), 1);
         assert_eq!(result[0].word, "cat");
@@ -140,11 +150,8 @@ mod tests {
     }
 
     #[test]
-    fn test_syllabify_word_banana() {
-        let phonemes: Vec<String> = vec!["B", "AH0", "N", "AE1", "N", "AH0"]
-            .into_iter()
-            .map(String::from)
-            .collect();
+    fn test_syllabify_word_banana_timing() {
+        let phonemes = phones(&["B", "AH0", "N", "AE1", "N", "AH0"]);
         let result = syllabify_word(&phonemes, 0.0, 1.0, "banana", 0);
         assert_eq!(result.len(), 3);
         // Timestamps should be consecutive
@@ -186,10 +193,7 @@ mod tests {
 
     #[test]
     fn test_syllabify_word_phonemes_have_timestamps() {
-        let phonemes: Vec<String> = vec!["K", "AE1", "T"]
-            .into_iter()
-            .map(String::from)
-            .collect();
+        let phonemes = phones(&["K", "AE1", "T"]);
         let result = syllabify_word(&phonemes, 1.0, 2.0, "cat", 0);
         assert_eq!(result.len(), 1);
         // Phonemes should have timestamps within the syllable
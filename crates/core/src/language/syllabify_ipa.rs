@@ -174,6 +174,29 @@ mod tests {
         }
     }
 
+    /// (label, start, end, PG16 group) rows for "cat".
+    const CAT: &[(&str, f64, f64, &str)] = &[
+        ("k", 0.0, 0.1, "voiced_stops"),
+        ("æ", 0.1, 0.2, "front_vowels"),
+        ("t", 0.2, 0.3, "voiced_stops"),
+    ];
+
+    /// (label, start, end, PG16 group) rows for "camel".
+    const CAMEL: &[(&str, f64, f64, &str)] = &[
+        ("k", 0.0, 0.05, "voiced_stops"),
+        ("æ", 0.05, 0.15, "front_vowels"),
+        ("m", 0.15, 0.2, "nasals"),
+        ("ə", 0.2, 0.3, "central_vowels"),
+        ("l", 0.3, 0.35, "laterals"),
+    ];
+
+    /// Split a fixture table into the phoneme and group slices `syllabify_ipa` takes.
+    fn fixture(rows: &[(&str, f64, f64, &str)]) -> (Vec<Phoneme>, Vec<String>) {
+        rows.iter()
+            .map(|&(label, start, end, group)| (make_phoneme(label, start, end), group.to_string()))
+            .unzip()
+    }
+
     #[test]
     fn test_pg16_sonority_ordering() {
         assert!(pg16_sonority("vowels") > pg16_sonority("glides"));
@@ -183,30 +206,55 @@ mod tests {
         assert_eq!(pg16_sonority("silence"), -1);
     }
 
+    #[test]
+    fn test_pg16_sonority_groups() {
+        let cases = [
+            ("voiced_stops", 0),
+            ("voiceless_stops", 0),
+            ("affricates", 1),
+            ("voiceless_fricatives", 2),
+            ("voiced_fricatives", 2),
+            ("nasals", 3),
+            ("laterals", 4),
+            ("rhotics", 4),
+            ("glides", 5),
+            ("approximants", 5),
+            ("central_vowels", 6),
+            ("front_vowels", 6),
+            ("back_vowels", 6),
+            ("diphthongs", 6),
+            ("vowels", 6),
+            ("consonants", 1),
+            ("silence", -1),
+            ("unknown_group", 1),
+        ];
+        for (group, expected) in cases {
+            assert_eq!(pg16_sonority(group), expected, "{}", group);
+        }
+    }
+
     #[test]
     fn test_syllabify_ipa_single_vowel() {
-        let phonemes = vec![make_phoneme("k", 0.0, 0.1), make_phoneme("æ", 0.1, 0.2), make_phoneme("t", 0.2, 0.3)];
-        let groups = vec!["voiced_stops".to_string(), "front_vowels".to_string(), "voiced_stops".to_string()];
+        let (phonemes, groups) = fixture(CAT);
         let result = syllabify_ipa(&phonemes, &groups, "cat", 0).unwrap();
         assert_eq!(result.len(), 1);
     }
 
+    #[test]
+    fn test_syllabify_ipa_word_metadata() {
+        let (phonemes, groups) = fixture(CAMEL);
+        let result = syllabify_ipa(&phonemes, &groups, "camel", 5).unwrap();
+        for syl in &result {
+            assert_eq!(syl.word, "camel");
+            assert_eq!(syl.word_index, 5);
+        }
+        assert!((result[0].start - 0.0).abs() < 1e-10);
+        assert!((result[result.len() - 1].end - 0.35).abs() < 1e-10);
+    }
+
     #[test]
     fn test_syllabify_ipa_two_vowels() {
-        let phonemes = vec![
-            make_phoneme("k", 0.0, 0.05),
-            make_phoneme("æ", 0.05, 0.15),
-            make_phoneme("m", 0.15, 0.2),
-            make_phoneme("ə", 0.2, 0.3),
-            make_phoneme("l", 0.3, 0.35),
-        ];
-        let groups = vec![
-            "voiced_stops".to_string(),
-            "front_vowels".to_string(),
-            "nasals".to_string(),
-            "central_vowels".to_string(),
-            "laterals".to_string(),
-        ];
+        let (phonemes, groups) = fixture(CAMEL);
         let result = syllabify_ipa(&phonemes, &groups, "camel", 0).unwrap();
         assert_eq!(result.len(), 2);
     }
@@ -290,23 +290,24 @@ fn dirs_or_default() -> std::path::PathBuf {
 mod tests {
     use super::*;
 
+    /// Canned whisper output shared by the parsing tests.
+    const WHISPER_JSON: &str = r#"{
+        "text": " Hello world",
+        "language": "en",
+        "segments": [
+            {
+                "text": " Hello world",
+                "words": [
+                    {"word": " Hello", "start": 0.0, "end": 0.5},
+                    {"word": " world", "start": 0.5, "end": 1.0}
+                ]
+            }
+        ]
+    }"#;
+
     #[test]
     fn test_parse_whisper_json() {
-        let json = r#"{
-            "text": " Hello world",
-            "language": "en",
-            "segments": [
-                {
-                    "text": " Hello world",
-                    "words": [
-                        {"word": " Hello", "start": 0.0, "end": 0.5},
-                        {"word": " world", "start": 0.5, "end": 1.0}
-                    ]
-                }
-            ]
-        }"#;
-
-        let result = parse_whisper_json(json, "en").unwrap();
+        let result = parse_whisper_json(WHISPER_JSON, "en").unwrap();
         assert_eq!(result.text, "Hello world");
         assert_eq!(result.language, "en");
         assert_eq!(result.words.len(), 2);
@@ -316,6 +317,17 @@ mod tests {
         assert!((result.words[1].end - 1.0).abs() < 0.001);
     }
 
+    #[test]
+    fn test_parse_whisper_json_strips_word_whitespace() {
+        let result = parse_whisper_json(WHISPER_JSON, "fr").unwrap();
+        // Language from the JSON wins over the default
+        assert_eq!(result.language, "en");
+        assert!(result
+            .words
+            .iter()
+            .all(|w| w.word == w.word.trim() && !w.word.is_empty()));
+    }
+
     #[test]
     fn test_parse_whisper_json_empty() {
         let json = r#"{"text": "", "segments": []}"#;
@@ -338,7 +350,8 @@ mod tests {
     #[cfg(feature = "whisper-native")]
     #[test]
     fn test_find_model_uses_cache_dir() {
-        let dir = std::env::temp_dir().join("glottisdale_test_model_cache");
+        let dir = std::env::temp_dir()
+            .join(format!("glottisdale_test_model_cache_{}", std::process::id()));
         std::fs::create_dir_all(&dir).unwrap();
 
         // Create a fake model file
@@ -6,9 +6,6 @@
 use std::path::{Path, PathBuf};
 
 use anyhow::Result;
-use rand::seq::SliceRandom;
-use rand::rngs::StdRng;
-use rand::SeedableRng;
 
 /// Speech/voice/music-themed adjectives.
 pub const ADJECTIVES: &[&str] = &[
@@ -90,19 +87,61 @@ pub const NOUNS: &[&str] = &[
     "sarabande", "solfege", "tarantella", "vibraphone", "bagpipe",
 ];
 
+// Run names go straight into directory names, so reject bad words at compile time
+const _: () = assert!(all_name_words(ADJECTIVES), "ADJECTIVES must be lowercase a-z words");
+const _: () = assert!(all_name_words(NOUNS), "NOUNS must be lowercase a-z words");
+
+/// True if `word` is lowercase ASCII letters, optionally joined by single hyphens.
+const fn is_name_word(word: &str) -> bool {
+    let bytes = word.as_bytes();
+    if bytes.is_empty() || bytes[0] == b'-' || bytes[bytes.len() - 1] == b'-' {
+        return false;
+    }
+    let mut i = 0;
+    while i < bytes.len() {
+        let b = bytes[i];
+        if !(b.is_ascii_lowercase() || (b == b'-' && bytes[i - 1] != b'-')) {
+            return false;
+        }
+        i += 1;
+    }
+    true
+}
+
+const fn all_name_words(words: &[&str]) -> bool {
+    let mut i = 0;
+    while i < words.len() {
+        if !is_name_word(words[i]) {
+            return false;
+        }
+        i += 1;
+    }
+    true
+}
+
 /// Generate an adjective-noun name like "breathy-bassoon".
 ///
 /// If seed is provided, the name is deterministic.
 pub fn generate_name(seed: Option<u64>) -> String {
-    let mut rng = match seed {
-        Some(s) => StdRng::seed_from_u64(s),
-        None => StdRng::from_entropy(),
+    // A seeded name is just an index into ADJECTIVES x NOUNS, so mix the
+    // seed directly rather than building an RNG for two picks
+    let h = match seed {
+        Some(s) => splitmix64(s),
+        None => rand::random(),
     };
-    let adj = ADJECTIVES.choose(&mut rng).unwrap();
-    let noun = NOUNS.choose(&mut rng).unwrap();
+    let adj = ADJECTIVES[(h % ADJECTIVES.len() as u64) as usize];
+    let noun = NOUNS[(h / ADJECTIVES.len() as u64 % NOUNS.len() as u64) as usize];
     format!("{}-{}", adj, noun)
 }
 
+/// SplitMix64 finalizer: spreads consecutive seeds across the name space.
+fn splitmix64(seed: u64) -> u64 {
+    let mut z = seed.wrapping_add(0x9E37_79B9_7F4A_7C15);
+    z = (z ^ (z >> 30)).wrapping_mul(0xBF58_476D_1CE4_E5B9);
+    z = (z ^ (z >> 27)).wrapping_mul(0x94D0_49BB_1331_11EB);
+    z ^ (z >> 31)
+}
+
 /// Generate a run ID like "2026-02-19-breathy-bassoon".
 pub fn generate_run_id(seed: Option<u64>) -> String {
     let today = chrono_today();
@@ -127,22 +166,41 @@ pub fn create_run_dir(
         format!("{}-{}", today, name)
     };
 
-    let candidate = root.join(&base_name);
-    if !candidate.exists() {
-        std::fs::create_dir_all(&candidate)?;
-        return Ok(candidate);
+    std::fs::create_dir_all(root)?;
+    let mut counter = next_run_counter(root, &base_name)?;
+    loop {
+        let candidate = if counter == 1 {
+            root.join(&base_name)
+        } else {
+            root.join(format!("{}-{}", base_name, counter))
+        };
+        // create_dir fails if the name was taken since the listing
+        match std::fs::create_dir(&candidate) {
+            Ok(()) => return Ok(candidate),
+            Err(e) if e.kind() == std::io::ErrorKind::AlreadyExists => counter += 1,
+            Err(e) => return Err(e.into()),
+        }
     }
+}
 
-    // Collision: append -2, -3, ...
-    let mut counter = 2u32;
-    loop {
-        let candidate = root.join(format!("{}-{}", base_name, counter));
-        if !candidate.exists() {
-            std::fs::create_dir_all(&candidate)?;
-            return Ok(candidate);
+/// Collision counter to try first for `base_name` in root: 1 for the bare
+/// name if it is free, otherwise one past the highest existing `-N` suffix.
+///
+/// Reads the directory once instead of stat-ing `-2`, `-3`, ... in turn.
+fn next_run_counter(root: &Path, base_name: &str) -> Result<u32> {
+    let prefix = format!("{}-", base_name);
+    let mut base_taken = false;
+    let mut highest = 1u32;
+    for entry in std::fs::read_dir(root)? {
+        let name = entry?.file_name();
+        let Some(name) = name.to_str() else { continue };
+        if name == base_name {
+            base_taken = true;
+        } else if let Some(n) = name.strip_prefix(&prefix).and_then(|s| s.parse::<u32>().ok()) {
+            highest = highest.max(n);
         }
-        counter += 1;
     }
+    Ok(if base_taken { highest + 1 } else { 1 })
 }
 
 /// Get today's date as ISO string (YYYY-MM-DD).
@@ -192,6 +250,16 @@ mod tests {
         }
     }
 
+    #[test]
+    fn test_is_name_word() {
+        for word in ["breathy", "a", "mezzo-forte"] {
+            assert!(is_name_word(word), "{}", word);
+        }
+        for word in ["", "Loud", "-x", "x-", "a--b", "b4", "café"] {
+            assert!(!is_name_word(word), "{}", word);
+        }
+    }
+
     #[test]
     fn test_no_duplicate_adjectives() {
         let mut seen = std::collections::HashSet::new();
@@ -240,6 +308,16 @@ mod tests {
         assert_ne!(a, b);
     }
 
+    #[test]
+    fn test_generate_name_consecutive_seeds_spread() {
+        let names: std::collections::HashSet<String> =
+            (0..100).map(|s| generate_name(Some(s))).collect();
+        assert_eq!(names.len(), 100);
+        let nouns: std::collections::HashSet<&str> =
+            names.iter().map(|n| n.split_once('-').unwrap().1).collect();
+        assert!(nouns.len() > 50, "only {} distinct nouns", nouns.len());
+    }
+
     #[test]
     fn test_generate_run_id_format() {
         let id = generate_run_id(Some(42));
@@ -260,7 +338,8 @@ mod tests {
 
     #[test]
     fn test_create_run_dir_basic() {
-        let root = std::env::temp_dir().join("glottisdale_names_test");
+        let root = std::env::temp_dir()
+            .join(format!("glottisdale_names_test_{}", std::process::id()));
         std::fs::create_dir_all(&root).unwrap();
 
         let dir = create_run_dir(&root, Some(42), None).unwrap();
@@ -272,7 +351,8 @@ mod tests {
 
     #[test]
     fn test_create_run_dir_collision() {
-        let root = std::env::temp_dir().join("glottisdale_names_collision");
+        let root = std::env::temp_dir()
+            .join(format!("glottisdale_names_collision_{}", std::process::id()));
         std::fs::create_dir_all(&root).unwrap();
 
         let dir1 = create_run_dir(&root, Some(42), None).unwrap();
@@ -283,9 +363,26 @@ mod tests {
         std::fs::remove_dir_all(&root).ok();
     }
 
+    #[test]
+    fn test_create_run_dir_after_highest_suffix() {
+        let root = std::env::temp_dir()
+            .join(format!("glottisdale_names_suffix_{}", std::process::id()));
+        std::fs::create_dir_all(&root).unwrap();
+
+        let first = create_run_dir(&root, None, Some("take")).unwrap();
+        let base = first.file_name().unwrap().to_string_lossy().to_string();
+        std::fs::create_dir(root.join(format!("{}-5", base))).unwrap();
+
+        let next = create_run_dir(&root, None, Some("take")).unwrap();
+        assert_eq!(next, root.join(format!("{}-6", base)));
+
+        std::fs::remove_dir_all(&root).ok();
+    }
+
     #[test]
     fn test_create_run_dir_custom_name() {
-        let root = std::env::temp_dir().join("glottisdale_names_custom");
+        let root = std::env::temp_dir()
+            .join(format!("glottisdale_names_custom_{}", std::process::id()));
         std::fs::create_dir_all(&root).unwrap();
 
         let dir = create_run_dir(&root, None, Some("my-custom-run")).unwrap();
@@ -45,7 +45,15 @@ pub fn midi_to_hz(midi_note: u8) -> f64 {
 pub fn parse_midi(path: &Path) -> Result<MidiTrack> {
     let data = std::fs::read(path)
         .with_context(|| format!("Failed to read MIDI file: {}", path.display()))?;
-    let smf = Smf::parse(&data)
+    parse_midi_bytes(&data)
+}
+
+/// Parse in-memory Standard MIDI File data into a MidiTrack.
+///
+/// Same behaviour as [`parse_midi`], for callers that already hold the
+/// file contents.
+pub fn parse_midi_bytes(data: &[u8]) -> Result<MidiTrack> {
+    let smf = Smf::parse(data)
         .map_err(|e| anyhow::anyhow!("Failed to parse MIDI: {}", e))?;
 
     let ticks_per_beat = match smf.header.timing {
@@ -155,9 +163,71 @@ pub fn parse_midi(path: &Path) -> Result<MidiTrack> {
     })
 }
 
+/// Standard MIDI file builders shared by the sing tests.
+#[cfg(test)]
+pub(crate) mod test_midi {
+    use std::sync::OnceLock;
+
+    use super::{parse_midi_bytes, MidiTrack};
+
+    /// Append `value` as a MIDI variable-length quantity.
+    fn push_vlq(out: &mut Vec<u8>, mut value: u32) {
+        let mut bytes = vec![(value & 0x7F) as u8];
+        value >>= 7;
+        while value > 0 {
+            bytes.push((value & 0x7F) as u8 | 0x80);
+            value >>= 7;
+        }
+        out.extend(bytes.iter().rev());
+    }
+
+    /// Build a single-track SMF at 120 BPM, 480 ticks per beat.
+    ///
+    /// `notes` are `(pitch, start_tick, end_tick)` on the given channel.
+    pub(crate) fn make_test_midi(notes: &[(u8, u32, u32)], channel: u8) -> Vec<u8> {
+        // (tick, event bytes); note-offs sort before note-ons at equal ticks
+        let mut events: Vec<(u32, [u8; 3])> = Vec::new();
+        for &(pitch, start, end) in notes {
+            events.push((start, [0x90 | channel, pitch, 100]));
+            events.push((end, [0x80 | channel, pitch, 64]));
+        }
+        events.sort_by_key(|(tick, msg)| (*tick, msg[0] & 0xF0 == 0x90));
+
+        // Tempo: 500,000 us per beat
+        let mut track = vec![0x00, 0xFF, 0x51, 0x03, 0x07, 0xA1, 0x20];
+        let mut last_tick = 0;
+        for (tick, msg) in events {
+            push_vlq(&mut track, tick - last_tick);
+            track.extend_from_slice(&msg);
+            last_tick = tick;
+        }
+        track.extend_from_slice(&[0x00, 0xFF, 0x2F, 0x00]);
+
+        let mut data = b"MThd".to_vec();
+        data.extend_from_slice(&6u32.to_be_bytes());
+        data.extend_from_slice(&0u16.to_be_bytes()); // format 0
+        data.extend_from_slice(&1u16.to_be_bytes()); // one track
+        data.extend_from_slice(&480u16.to_be_bytes());
+        data.extend_from_slice(b"MTrk");
+        data.extend_from_slice(&(track.len() as u32).to_be_bytes());
+        data.extend_from_slice(&track);
+        data
+    }
+
+    /// Notes C4, E4, G4 at 0-0.5s, 0.5-1.0s and 1.0-2.0s.
+    pub(crate) const ARPEGGIO: &[(u8, u32, u32)] = &[(60, 0, 480), (64, 480, 960), (67, 960, 1920)];
+
+    /// [`ARPEGGIO`] on channel 0, parsed once and shared across tests.
+    pub(crate) fn arpeggio_track() -> &'static MidiTrack {
+        static TRACK: OnceLock<MidiTrack> = OnceLock::new();
+        TRACK.get_or_init(|| parse_midi_bytes(&make_test_midi(ARPEGGIO, 0)).unwrap())
+    }
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
+    use super::test_midi::{arpeggio_track, make_test_midi, ARPEGGIO};
 
     #[test]
     fn test_midi_to_hz() {
@@ -185,4 +255,40 @@ mod tests {
         let result = parse_midi(Path::new("/nonexistent.mid"));
         assert!(result.is_err());
     }
+
+    #[test]
+    fn test_parse_midi_extracts_notes() {
+        let track = arpeggio_track();
+        let pitches: Vec<u8> = track.notes.iter().map(|n| n.pitch).collect();
+        assert_eq!(pitches, vec![60, 64, 67]);
+        assert!((track.notes[1].start - 0.5).abs() < 1e-4);
+        assert!((track.notes[2].duration() - 1.0).abs() < 1e-4);
+        assert_eq!(track.tempo, 120.0);
+        assert!((track.total_duration - 2.0).abs() < 1e-4);
+    }
+
+    #[test]
+    fn test_parse_midi_skips_drum_channel() {
+        let track = parse_midi_bytes(&make_test_midi(ARPEGGIO, 9)).unwrap();
+        assert!(track.notes.is_empty());
+    }
+
+    #[test]
+    fn test_parse_midi_bytes_invalid() {
+        assert!(parse_midi_bytes(b"not a midi file").is_err());
+    }
+
+    #[test]
+    fn test_parse_midi_reads_file() {
+        let dir = std::env::temp_dir()
+            .join(format!("glottisdale_midi_file_{}", std::process::id()));
+        std::fs::create_dir_all(&dir).unwrap();
+        let path = dir.join("melody.mid");
+        std::fs::write(&path, make_test_midi(ARPEGGIO, 0)).unwrap();
+
+        let track = parse_midi(&path).unwrap();
+        assert_eq!(track.notes.len(), 3);
+
+        std::fs::remove_dir_all(&dir).ok();
+    }
 }
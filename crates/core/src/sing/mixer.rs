@@ -5,9 +5,9 @@ use std::path::{Path, PathBuf};
 use anyhow::Result;
 
 use crate::audio::effects::mix_audio;
-use crate::audio::io::{read_wav, write_wav};
+use crate::audio::io::write_wav;
 use crate::sing::midi_parser::MidiTrack;
-use crate::sing::synthesize::synthesize_preview;
+use crate::sing::synthesize::{synthesize_mix, SAMPLE_RATE as MIDI_SR};
 
 /// Mix vocal audio with MIDI backing.
 ///
@@ -31,13 +31,10 @@ pub fn mix_tracks(
     // Write a cappella
     write_wav(&acappella_path, vocal_samples, vocal_sr)?;
 
-    // Synthesize MIDI backing
-    let midi_wav = output_dir.join("midi_backing.wav");
-    let has_midi = synthesize_preview(midi_tracks, &midi_wav).is_ok();
-
-    if has_midi && midi_wav.exists() {
-        // Load the MIDI backing and mix
-        let (midi_samples, _midi_sr) = read_wav(&midi_wav)?;
+    // Synthesize MIDI backing; the WAV is kept as a run artifact, but the
+    // mix uses the in-memory samples rather than reading it back
+    if let Ok(mut midi) = synthesize_mix(midi_tracks) {
+        write_wav(&output_dir.join("midi_backing.wav"), &midi, MIDI_SR)?;
 
         // Apply volume adjustments
         let mut vocals = vocal_samples.to_vec();
@@ -45,15 +42,11 @@ pub fn mix_tracks(
             crate::audio::effects::adjust_volume(&mut vocals, vocal_db);
         }
 
-        let mut midi = midi_samples;
         // Resample MIDI to match vocal sample rate if needed
         // (synthesizer outputs at 22050, vocals at 16000)
-        if !midi.is_empty() {
-            let midi_sr = 22050; // from synthesizer
-            if midi_sr != vocal_sr {
-                if let Ok(resampled) = crate::audio::io::resample(&midi, midi_sr, vocal_sr) {
-                    midi = resampled;
-                }
+        if !midi.is_empty() && MIDI_SR != vocal_sr {
+            if let Ok(resampled) = crate::audio::io::resample(&midi, MIDI_SR, vocal_sr) {
+                midi = resampled;
             }
         }
 
@@ -117,6 +110,7 @@ mod tests {
         let (full_mix, acappella) = result.unwrap();
         assert!(acappella.exists());
         assert!(full_mix.exists());
+        assert!(dir.join("midi_backing.wav").exists());
 
         std::fs::remove_dir_all(&dir).ok();
     }
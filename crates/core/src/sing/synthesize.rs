@@ -1,13 +1,11 @@
-//! Synthesize MIDI notes to WAV preview using sine waves.
-
-use std::path::Path;
+//! Synthesize MIDI notes to preview audio using sine waves.
 
 use anyhow::Result;
 
-use crate::audio::io::write_wav;
 use crate::sing::midi_parser::{midi_to_hz, MidiTrack, Note};
 
-const SAMPLE_RATE: u32 = 22050;
+/// Sample rate of synthesized MIDI audio.
+pub const SAMPLE_RATE: u32 = 22050;
 const MAX_DURATION: f64 = 30.0;
 
 /// Synthesize a single note to audio samples using a sine wave with envelope.
@@ -129,11 +127,8 @@ pub fn synthesize_track(track: &MidiTrack, sr: u32) -> Vec<f64> {
     audio
 }
 
-/// Synthesize and mix multiple MIDI tracks into a preview WAV.
-pub fn synthesize_preview(
-    tracks: &[MidiTrack],
-    output_path: &Path,
-) -> Result<()> {
+/// Synthesize and mix multiple MIDI tracks at [`SAMPLE_RATE`], peak-normalized.
+pub fn synthesize_mix(tracks: &[MidiTrack]) -> Result<Vec<f64>> {
     let sr = SAMPLE_RATE;
 
     let mut track_audio: Vec<Vec<f64>> = Vec::new();
@@ -170,8 +165,7 @@ pub fn synthesize_preview(
         }
     }
 
-    write_wav(output_path, &mixed, sr)?;
-    Ok(())
+    Ok(mixed)
 }
 
 #[cfg(test)]
@@ -234,6 +228,21 @@ mod tests {
         assert!(!audio.is_empty());
     }
 
+    #[test]
+    fn test_synthesize_mix_normalizes_peak() {
+        let track = MidiTrack {
+            notes: vec![Note { pitch: 60, start: 0.0, end: 0.5, velocity: 100 }],
+            tempo: 120.0,
+            program: 0,
+            is_drum: false,
+            total_duration: 0.5,
+        };
+        let mixed = synthesize_mix(&[track]).unwrap();
+        let peak = mixed.iter().map(|s| s.abs()).fold(0.0f64, f64::max);
+        assert!((peak - 0.9).abs() < 1e-9);
+        assert!(synthesize_mix(&[]).is_err());
+    }
+
     #[test]
     fn test_midi_to_hz_in_synthesize() {
         // Verify note frequencies are reasonable
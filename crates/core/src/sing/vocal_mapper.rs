@@ -322,9 +322,18 @@ mod tests {
 
     #[test]
     fn test_classify_note_duration() {
-        assert_eq!(classify_note_duration(0.1), DurationClass::Short);
-        assert_eq!(classify_note_duration(0.5), DurationClass::Medium);
-        assert_eq!(classify_note_duration(1.5), DurationClass::Long);
+        let cases = [
+            (0.1, DurationClass::Short),
+            (0.15, DurationClass::Short),
+            (0.2, DurationClass::Medium),
+            (0.5, DurationClass::Medium),
+            (0.8, DurationClass::Medium),
+            (1.0, DurationClass::Long),
+            (1.5, DurationClass::Long),
+        ];
+        for (duration, expected) in cases {
+            assert_eq!(classify_note_duration(duration), expected, "{}", duration);
+        }
     }
 
     #[test]
@@ -362,6 +371,15 @@ mod tests {
         assert_eq!(mappings[1].note_pitch, 64);
     }
 
+    #[test]
+    fn test_plan_note_mapping_from_parsed_midi() {
+        let track = crate::sing::midi_parser::test_midi::arpeggio_track();
+        let mappings = plan_note_mapping(&track.notes, 10, Some(42), 2.0, 0.3);
+        let pitches: Vec<u8> = mappings.iter().map(|m| m.note_pitch).collect();
+        assert_eq!(pitches, vec![60, 64, 67]);
+        assert_eq!(mappings[0].duration_class, DurationClass::Medium);
+    }
+
     #[test]
     fn test_plan_note_mapping_deterministic() {
         let notes = vec![
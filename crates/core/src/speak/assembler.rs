@@ -5,9 +5,9 @@ use std::path::{Path, PathBuf};
 
 use anyhow::Result;
 
-use crate::audio::analysis::{compute_rms, estimate_f0};
 use crate::audio::effects::{
-    adjust_volume, concatenate, concatenate_with_gaps, cut_clip, pitch_shift, time_stretch,
+    concatenate, concatenate_with_gaps, cut_clip, normalize_pitch_clips, normalize_volume_clips,
+    pitch_shift, time_stretch,
 };
 use crate::audio::io::write_wav;
 use crate::speak::matcher::MatchResult;
@@ -16,7 +16,7 @@ use crate::speak::matcher::MatchResult;
 const WORD_PAUSE_S: f64 = 0.12;
 
 /// Timing for a single output syllable.
-#[derive(Debug, Clone)]
+#[derive(Debug, Clone, Copy, PartialEq)]
 pub struct TimingPlan {
     /// Desired start time in output
     pub target_start: f64,
@@ -38,7 +38,7 @@ pub fn plan_timing(
     timing_strictness: f64,
 ) -> Vec<TimingPlan> {
     let word_starts: HashSet<usize> = word_boundaries.iter().copied().collect();
-    let mut plans = Vec::new();
+    let mut plans = Vec::with_capacity(matches.len());
     let mut cursor = 0.0;
 
     for (i, m) in matches.iter().enumerate() {
@@ -117,77 +117,6 @@ fn group_contiguous_runs(matches: &[MatchResult]) -> Vec<Vec<usize>> {
     runs
 }
 
-/// Normalize volume across clips to median RMS.
-fn normalize_volume_clips(clips: &mut [Vec<f64>]) {
-    let rms_values: Vec<f64> = clips
-        .iter()
-        .map(|c| compute_rms(c))
-        .filter(|&r| r > 1e-6)
-        .collect();
-
-    if rms_values.is_empty() {
-        return;
-    }
-
-    let mut sorted = rms_values.clone();
-    sorted.sort_by(|a, b| a.partial_cmp(b).unwrap());
-    let target_rms = sorted[sorted.len() / 2];
-
-    if target_rms < 1e-6 {
-        return;
-    }
-
-    for clip in clips.iter_mut() {
-        let clip_rms = compute_rms(clip);
-        if clip_rms < 1e-6 {
-            continue;
-        }
-        let db_adjust = 20.0 * (target_rms / clip_rms).log10();
-        let db_adjust = db_adjust.clamp(-20.0, 20.0);
-        if db_adjust.abs() >= 0.5 {
-            adjust_volume(clip, db_adjust);
-        }
-    }
-}
-
-/// Minimum F0 target for pitch normalization (Hz).
-const MIN_PITCH_TARGET_HZ: f64 = 160.0;
-
-/// Normalize pitch across clips toward median F0.
-fn normalize_pitch_clips(clips: &mut [Vec<f64>], sr: u32, pitch_range: f64) {
-    let f0_values: Vec<(usize, f64)> = clips
-        .iter()
-        .enumerate()
-        .filter_map(|(i, c)| estimate_f0(c, sr, 80, 600).map(|f0| (i, f0)))
-        .collect();
-
-    if f0_values.is_empty() {
-        return;
-    }
-
-    let mut sorted_f0s: Vec<f64> = f0_values.iter().map(|(_, f0)| *f0).collect();
-    sorted_f0s.sort_by(|a, b| a.partial_cmp(b).unwrap());
-    let median_f0 = sorted_f0s[sorted_f0s.len() / 2];
-    let target_f0 = median_f0.max(MIN_PITCH_TARGET_HZ);
-
-    log::info!(
-        "Pitch normalization: median F0 = {:.1}Hz, target F0 = {:.1}Hz (from {} voiced clips)",
-        median_f0,
-        target_f0,
-        f0_values.len()
-    );
-
-    for (i, f0) in &f0_values {
-        let semitones_shift = 12.0 * (target_f0 / f0).log2();
-        let semitones_shift = semitones_shift.clamp(-pitch_range, pitch_range);
-        if semitones_shift.abs() >= 0.1 {
-            if let Ok(shifted) = pitch_shift(&clips[*i], sr, semitones_shift) {
-                clips[*i] = shifted;
-            }
-        }
-    }
-}
-
 /// Cut, stretch, and concatenate matched syllables into output audio.
 ///
 /// Consecutive matches from adjacent positions in the same source file
@@ -205,8 +134,8 @@ pub fn assemble(
 ) -> Result<PathBuf> {
     let runs = group_contiguous_runs(matches);
 
-    let mut clips: Vec<Vec<f64>> = Vec::new();
-    let mut gap_durations: Vec<f64> = Vec::new();
+    let mut clips: Vec<Vec<f64>> = Vec::with_capacity(runs.len());
+    let mut gap_durations: Vec<f64> = Vec::with_capacity(runs.len().saturating_sub(1));
     let mut sample_rate = 16000u32;
 
     for (run_idx, run) in runs.iter().enumerate() {
@@ -341,6 +270,18 @@ mod tests {
         assert!((timing[1].target_start - (0.3 + WORD_PAUSE_S)).abs() < 1e-10);
     }
 
+    #[test]
+    fn test_plan_timing_single_syllable() {
+        let matches = vec![make_match(&["K"], &["K"], 0, "a.wav", 0.0, 0.3)];
+        let timing = plan_timing(&matches, &[0], 0.25, None, 0.8);
+        let expected = TimingPlan {
+            target_start: 0.0,
+            target_duration: 0.3,
+            stretch_factor: 1.0,
+        };
+        assert_eq!(timing, vec![expected]);
+    }
+
     #[test]
     fn test_plan_timing_no_word_pause_same_word() {
         let matches = vec![
@@ -365,60 +306,28 @@ mod tests {
     }
 
     #[test]
-    fn test_group_contiguous_runs() {
-        let matches = vec![
-            make_match(&["K"], &["K"], 0, "a.wav", 0.0, 0.1),
-            make_match(&["AE"], &["AE"], 1, "a.wav", 0.1, 0.2),
-            make_match(&["T"], &["T"], 0, "b.wav", 0.0, 0.1),
-            make_match(&["D"], &["D"], 1, "b.wav", 0.1, 0.2),
-        ];
-        let runs = group_contiguous_runs(&matches);
-        assert_eq!(runs.len(), 2);
-        assert_eq!(runs[0], vec![0, 1]); // adjacent in a.wav
-        assert_eq!(runs[1], vec![2, 3]); // adjacent in b.wav
-    }
-
-    #[test]
-    fn test_group_contiguous_runs_isolated() {
-        let matches = vec![
-            make_match(&["K"], &["K"], 0, "a.wav", 0.0, 0.1),
-            make_match(&["T"], &["T"], 5, "a.wav", 0.5, 0.6), // non-adjacent
-            make_match(&["D"], &["D"], 0, "b.wav", 0.0, 0.1), // different source
-        ];
-        let runs = group_contiguous_runs(&matches);
-        assert_eq!(runs.len(), 3);
-    }
-
-    #[test]
-    fn test_group_contiguous_runs_empty() {
-        let runs = group_contiguous_runs(&[]);
-        assert!(runs.is_empty());
-    }
-
-    #[test]
-    fn test_normalize_volume_clips() {
-        let mut clips = vec![
-            vec![0.5; 100],   // RMS ~0.5
-            vec![0.1; 100],   // RMS ~0.1
-            vec![0.3; 100],   // RMS ~0.3
-        ];
-        normalize_volume_clips(&mut clips);
-        // After normalization, RMS values should be closer together
-        let rms_after: Vec<f64> = clips.iter().map(|c| compute_rms(c)).collect();
-        let range_before = 0.5 - 0.1; // 0.4
-        let range_after = rms_after.iter().cloned().fold(f64::NEG_INFINITY, f64::max)
-            - rms_after.iter().cloned().fold(f64::INFINITY, f64::min);
-        assert!(range_after < range_before);
-    }
-
-    #[test]
-    fn test_normalize_volume_silent_clips() {
-        let mut clips = vec![
-            vec![0.0; 100],  // silent
-            vec![0.5; 100],
+    fn test_group_contiguous_runs_cases() {
+        // (source, index) per match -> expected runs
+        let cases: Vec<(&[(&str, usize)], Vec<Vec<usize>>)> = vec![
+            (&[("a.wav", 0), ("a.wav", 1), ("a.wav", 2)], vec![vec![0, 1, 2]]),
+            // Non-adjacent index, then a different source
+            (&[("a.wav", 0), ("a.wav", 5), ("b.wav", 0)], vec![vec![0], vec![1], vec![2]]),
+            (
+                &[("a.wav", 0), ("a.wav", 1), ("b.wav", 0), ("b.wav", 1)],
+                vec![vec![0, 1], vec![2, 3]],
+            ),
+            (&[], vec![]),
         ];
-        // Should not crash on silent clips
-        normalize_volume_clips(&mut clips);
+        for (spec, expected) in cases {
+            let matches: Vec<MatchResult> = spec
+                .iter()
+                .map(|&(source, index)| {
+                    let start = index as f64 * 0.1;
+                    make_match(&["K"], &["K"], index, source, start, start + 0.1)
+                })
+                .collect();
+            assert_eq!(group_contiguous_runs(&matches), expected, "{:?}", spec);
+        }
     }
 
     #[test]
@@ -5,7 +5,7 @@
 
 use serde::Serialize;
 
-use crate::speak::phonetic_distance::{phoneme_distance, syllable_distance};
+use crate::speak::phonetic_distance::{phoneme_distance, syllable_distance_matrix, PhonemeEncoder};
 use crate::speak::syllable_bank::SyllableEntry;
 
 /// Default bonus applied when consecutive target syllables match to adjacent
@@ -65,22 +65,31 @@ pub fn match_syllables(
 
     let bonus = continuity_bonus.unwrap_or(CONTINUITY_BONUS);
 
+    // Encode phonemes once so the n x b distance matrix compares integer
+    // codes against packed feature bitmaps instead of hashing label strings
+    let mut encoder = PhonemeEncoder::new();
+    let bank_codes = encoder.encode_all(bank.iter().map(|entry| entry.phoneme_labels.as_slice()));
+    let target_codes = encoder.encode_all(target_syllables.iter().map(Vec::as_slice));
+
     // Pre-compute pairwise distances (with small stress penalty for ties)
-    let mut dists: Vec<Vec<f64>> = Vec::with_capacity(n);
-    for (i, target) in target_syllables.iter().enumerate() {
-        let stress = target_stresses.and_then(|ts| ts.get(i).copied().flatten());
-        let mut row = Vec::with_capacity(b);
-        for entry in bank {
-            let d = syllable_distance(target, &entry.phoneme_labels) as f64;
-            let penalty = if stress.is_some() && entry.stress != stress {
-                0.1
-            } else {
-                0.0
-            };
-            row.push(d + penalty);
-        }
-        dists.push(row);
-    }
+    let dists: Vec<Vec<f64>> = syllable_distance_matrix(&target_codes, &bank_codes)
+        .into_iter()
+        .enumerate()
+        .map(|(i, row)| {
+            let stress = target_stresses.and_then(|ts| ts.get(i).copied().flatten());
+            row.into_iter()
+                .zip(bank)
+                .map(|(d, entry)| {
+                    let penalty = if stress.is_some() && entry.stress != stress {
+                        0.1
+                    } else {
+                        0.0
+                    };
+                    d as f64 + penalty
+                })
+                .collect()
+        })
+        .collect();
 
     // Pre-compute predecessor map: pred[j] = k iff bank[k] → bank[j]
     let mut pred: Vec<Option<usize>> = vec![None; b];
@@ -229,19 +238,6 @@ mod tests {
         }
     }
 
-    #[test]
-    fn test_match_exact() {
-        let bank = vec![
-            make_entry(&["K", "AE1", "T"], 0, "a.wav", "cat", Some(1)),
-            make_entry(&["D", "AO1", "G"], 1, "a.wav", "dog", Some(1)),
-        ];
-        let targets = vec![vec!["K".into(), "AE1".into(), "T".into()]];
-        let matches = match_syllables(&targets, &bank, None, None);
-        assert_eq!(matches.len(), 1);
-        assert_eq!(matches[0].entry.word, "cat");
-        assert_eq!(matches[0].distance, 0);
-    }
-
     #[test]
     fn test_match_best() {
         let bank = vec![
@@ -251,7 +247,9 @@ mod tests {
         // Target K AE1 T should match "cat" exactly (distance 0)
         let targets = vec![vec!["K".into(), "AE1".into(), "T".into()]];
         let matches = match_syllables(&targets, &bank, None, None);
+        assert_eq!(matches.len(), 1);
         assert_eq!(matches[0].entry.word, "cat");
+        assert_eq!(matches[0].distance, 0);
     }
 
     #[test]
@@ -288,6 +286,38 @@ mod tests {
         assert_eq!(matches[1].entry.index, 1);
     }
 
+    /// cat@a.wav:0, a near-miss "dog" adjacent to it, and an exact "dog" elsewhere.
+    fn near_miss_bank() -> Vec<SyllableEntry> {
+        vec![
+            make_entry(&["K", "AE1", "T"], 0, "a.wav", "cat", Some(1)),
+            make_entry(&["D", "AO1", "K"], 1, "a.wav", "dock", Some(1)),
+            make_entry(&["D", "AO1", "G"], 0, "b.wav", "dog", Some(1)),
+        ]
+    }
+
+    #[test]
+    fn test_match_continuity_over_slightly_worse_match() {
+        let targets = vec![
+            vec!["K".into(), "AE1".into(), "T".into()],
+            vec!["D".into(), "AO1".into(), "G".into()],
+        ];
+        let matches = match_syllables(&targets, &near_miss_bank(), None, None);
+        // Distance 1 from the adjacent syllable beats an exact match elsewhere
+        assert_eq!(matches[1].entry.word, "dock");
+        assert_eq!(matches[1].distance, 1);
+    }
+
+    #[test]
+    fn test_match_low_bonus_allows_better_match() {
+        let targets = vec![
+            vec!["K".into(), "AE1".into(), "T".into()],
+            vec!["D".into(), "AO1".into(), "G".into()],
+        ];
+        let matches = match_syllables(&targets, &near_miss_bank(), None, Some(0));
+        assert_eq!(matches[1].entry.word, "dog");
+        assert_eq!(matches[1].distance, 0);
+    }
+
     #[test]
     fn test_match_empty_inputs() {
         let bank = vec![make_entry(&["K"], 0, "a.wav", "k", None)];
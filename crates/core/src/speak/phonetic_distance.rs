@@ -2,6 +2,8 @@
 
 use std::collections::HashMap;
 
+pub use crate::language::g2p::strip_stress;
+
 lazy_static::lazy_static! {
     /// IPA-to-ARPABET mapping for phonemes produced by BFA aligner.
     static ref IPA_TO_ARPABET: Vec<(&'static str, &'static str)> = vec![
@@ -27,6 +29,13 @@ lazy_static::lazy_static! {
         ("j", "Y"), ("w", "W"), ("ɥ", "W"),
     ];
 
+    /// Whole-label IPA lookups, so the common single-segment labels skip the
+    /// prefix scan over IPA_TO_ARPABET.
+    static ref IPA_EXACT: HashMap<&'static str, &'static str> = IPA_TO_ARPABET
+        .iter()
+        .filter_map(|(ipa, _)| Some((*ipa, ipa_prefix_lookup(ipa)?)))
+        .collect();
+
     /// Articulatory features for each ARPABET phoneme.
     static ref FEATURES: HashMap<&'static str, &'static [&'static str]> = {
         let mut m = HashMap::new();
@@ -73,13 +82,65 @@ lazy_static::lazy_static! {
         m.insert("ER", &["vowel", "mid", "central", "rounded", "tense"][..]);
         m
     };
+
+    /// Phonemes in FEATURES, sorted; a phoneme's index is its code.
+    static ref KNOWN_PHONEMES: Vec<&'static str> = {
+        let mut names: Vec<&'static str> = FEATURES.keys().copied().collect();
+        names.sort_unstable();
+        names
+    };
+
+    /// Code for each phoneme in FEATURES, used by [`PhonemeEncoder`].
+    static ref KNOWN_CODES: HashMap<&'static str, u16> = KNOWN_PHONEMES
+        .iter()
+        .enumerate()
+        .map(|(i, p)| (*p, i as u16))
+        .collect();
+
+    /// FEATURES packed into one bitmap per code: [`VOWEL_BIT`] for the type,
+    /// then one bit per distinct (slot, value) pair, so every slot is one-hot.
+    static ref FEATURE_BITS: Vec<u64> = {
+        let mut bit_of: HashMap<(usize, &'static str), u32> = HashMap::new();
+        let bits: Vec<u64> = KNOWN_PHONEMES
+            .iter()
+            .map(|p| {
+                let feats = FEATURES[p];
+                let mut bits = if feats[0] == "vowel" { VOWEL_BIT } else { 0 };
+                for (slot, value) in feats.iter().enumerate().skip(1) {
+                    let next = bit_of.len() as u32 + 1;
+                    bits |= 1 << *bit_of.entry((slot, *value)).or_insert(next);
+                }
+                bits
+            })
+            .collect();
+        assert!(bit_of.len() < 64, "feature values no longer fit in a u64");
+        bits
+    };
 }
 
 const CROSS_TYPE_DISTANCE: i32 = 5;
 
-/// Strip trailing stress marker (0, 1, 2) from an ARPABET phoneme.
-pub fn strip_stress(phoneme: &str) -> &str {
-    phoneme.trim_end_matches(|c: char| c.is_ascii_digit())
+/// Set in [`FEATURE_BITS`] for vowels, clear for consonants.
+const VOWEL_BIT: u64 = 1;
+
+/// Distance between two packed feature bitmaps.
+///
+/// Phonemes of the same type fill the same one-hot slots, so each slot that
+/// differs flips exactly two bits.
+fn feature_bits_distance(a: u64, b: u64) -> i32 {
+    let diff = a ^ b;
+    if diff & VOWEL_BIT != 0 {
+        return CROSS_TYPE_DISTANCE;
+    }
+    (diff.count_ones() / 2) as i32
+}
+
+/// First IPA_TO_ARPABET entry that prefixes `ipa` (diphthongs are listed first).
+fn ipa_prefix_lookup(ipa: &str) -> Option<&'static str> {
+    IPA_TO_ARPABET
+        .iter()
+        .find(|(prefix, _)| ipa.starts_with(prefix))
+        .map(|(_, arpabet)| *arpabet)
 }
 
 /// Convert an IPA phoneme to ARPABET if possible, passthrough otherwise.
@@ -97,14 +158,10 @@ pub fn normalize_phoneme(phoneme: &str) -> String {
     // Strip IPA length markers
     let cleaned = phoneme.trim_end_matches(['ː', 'ˑ']);
 
-    // Try multi-char diphthongs first, then single-char
-    for (ipa, arpabet) in IPA_TO_ARPABET.iter() {
-        if cleaned.starts_with(ipa) {
-            return arpabet.to_string();
-        }
+    match IPA_EXACT.get(cleaned).copied().or_else(|| ipa_prefix_lookup(cleaned)) {
+        Some(arpabet) => arpabet.to_string(),
+        None => phoneme.to_string(),
     }
-
-    phoneme.to_string()
 }
 
 /// Compute articulatory feature distance between two ARPABET phonemes.
@@ -118,35 +175,120 @@ pub fn phoneme_distance(a: &str, b: &str) -> i32 {
         return 0;
     }
 
-    let feat_a = FEATURES.get(a_base);
-    let feat_b = FEATURES.get(b_base);
-
-    match (feat_a, feat_b) {
-        (Some(fa), Some(fb)) => {
-            if fa[0] != fb[0] {
-                return CROSS_TYPE_DISTANCE;
-            }
-            fa[1..].iter().zip(fb[1..].iter()).filter(|(a, b)| a != b).count() as i32
-        }
+    match (KNOWN_CODES.get(a_base), KNOWN_CODES.get(b_base)) {
+        (Some(&ca), Some(&cb)) => code_distance(ca, cb),
         _ => CROSS_TYPE_DISTANCE,
     }
 }
 
 /// Compute distance between two syllables (lists of ARPABET phonemes).
 pub fn syllable_distance(a: &[String], b: &[String]) -> i32 {
-    let max_len = a.len().max(b.len());
-    if max_len == 0 {
-        return 0;
+    // Pair phonemes position by position; each unpaired phoneme on the
+    // longer side costs the cross-type maximum
+    let common: i32 = a.iter().zip(b).map(|(pa, pb)| phoneme_distance(pa, pb)).sum();
+    common + a.len().abs_diff(b.len()) as i32 * CROSS_TYPE_DISTANCE
+}
+
+/// Interns phoneme labels as small integer codes for repeated distance checks.
+///
+/// Known ARPABET phonemes share fixed codes backed by packed feature bitmaps;
+/// any other label gets its own code, so equal unknown labels still
+/// compare as identical. Stress markers are ignored, as in [`phoneme_distance`].
+#[derive(Debug, Default)]
+pub struct PhonemeEncoder<'a> {
+    unknown: HashMap<&'a str, u16>,
+}
+
+impl<'a> PhonemeEncoder<'a> {
+    pub fn new() -> Self {
+        Self::default()
+    }
+
+    /// Encode a single phoneme label.
+    pub fn encode_one(&mut self, label: &'a str) -> u16 {
+        let base = strip_stress(label);
+        if let Some(&code) = KNOWN_CODES.get(base) {
+            return code;
+        }
+        let next = (KNOWN_CODES.len() + self.unknown.len()) as u16;
+        *self.unknown.entry(base).or_insert(next)
+    }
+
+    /// Encode a syllable's phoneme labels.
+    pub fn encode(&mut self, labels: &'a [String]) -> Vec<u16> {
+        labels.iter().map(|l| self.encode_one(l)).collect()
     }
 
-    let mut total = 0;
-    for i in 0..max_len {
-        match (a.get(i), b.get(i)) {
-            (Some(pa), Some(pb)) => total += phoneme_distance(pa, pb),
-            _ => total += CROSS_TYPE_DISTANCE,
+    /// Encode many syllables into one contiguous [`EncodedSyllables`] buffer.
+    pub fn encode_all<I>(&mut self, syllables: I) -> EncodedSyllables
+    where
+        I: IntoIterator<Item = &'a [String]>,
+    {
+        let mut encoded = EncodedSyllables::default();
+        for labels in syllables {
+            encoded.codes.extend(labels.iter().map(|l| self.encode_one(l)));
+            encoded.ends.push(encoded.codes.len());
         }
+        encoded
     }
-    total
+}
+
+/// Encoded syllables stored back to back in a single buffer.
+///
+/// Scoring a target against a whole bank then walks one contiguous slice of
+/// codes instead of chasing a separate allocation per syllable.
+#[derive(Debug, Clone, Default)]
+pub struct EncodedSyllables {
+    codes: Vec<u16>,
+    /// End offset of each syllable in `codes`
+    ends: Vec<usize>,
+}
+
+impl EncodedSyllables {
+    pub fn len(&self) -> usize {
+        self.ends.len()
+    }
+
+    pub fn is_empty(&self) -> bool {
+        self.ends.is_empty()
+    }
+
+    /// Codes of the syllable at `index`.
+    pub fn get(&self, index: usize) -> &[u16] {
+        let start = if index == 0 { 0 } else { self.ends[index - 1] };
+        &self.codes[start..self.ends[index]]
+    }
+
+    /// Iterate over each syllable's codes, in order.
+    pub fn iter(&self) -> impl Iterator<Item = &[u16]> + '_ {
+        let starts = std::iter::once(0).chain(self.ends.iter().copied());
+        starts.zip(&self.ends).map(|(start, &end)| &self.codes[start..end])
+    }
+}
+
+/// [`phoneme_distance`] on codes from the same [`PhonemeEncoder`].
+pub fn code_distance(a: u16, b: u16) -> i32 {
+    if a == b {
+        return 0;
+    }
+    match (FEATURE_BITS.get(a as usize), FEATURE_BITS.get(b as usize)) {
+        (Some(&fa), Some(&fb)) => feature_bits_distance(fa, fb),
+        _ => CROSS_TYPE_DISTANCE,
+    }
+}
+
+/// [`syllable_distance`] on codes from the same [`PhonemeEncoder`].
+pub fn syllable_code_distance(a: &[u16], b: &[u16]) -> i32 {
+    let common: i32 = a.iter().zip(b).map(|(&pa, &pb)| code_distance(pa, pb)).sum();
+    common + a.len().abs_diff(b.len()) as i32 * CROSS_TYPE_DISTANCE
+}
+
+/// [`syllable_code_distance`] from every syllable in `a` (rows) to every
+/// syllable in `b` (columns).
+pub fn syllable_distance_matrix(a: &EncodedSyllables, b: &EncodedSyllables) -> Vec<Vec<i32>> {
+    a.iter()
+        .map(|sa| b.iter().map(|sb| syllable_code_distance(sa, sb)).collect())
+        .collect()
 }
 
 #[cfg(test)]
@@ -191,6 +333,91 @@ mod tests {
         assert!(syllable_distance(&a, &b) > 0); // missing phoneme penalty
     }
 
+    #[test]
+    fn test_syllable_distance_cases() {
+        let cases: &[(&[&str], &[&str], i32)] = &[
+            (&[], &[], 0),
+            (&["P", "AE1"], &["B", "AE0"], 1),
+            (&["K", "AE1", "T"], &["K", "AE1"], CROSS_TYPE_DISTANCE),
+            (&[], &["K", "AE1"], 2 * CROSS_TYPE_DISTANCE),
+        ];
+        for (a, b, expected) in cases {
+            let a: Vec<String> = a.iter().map(|s| s.to_string()).collect();
+            let b: Vec<String> = b.iter().map(|s| s.to_string()).collect();
+            assert_eq!(syllable_distance(&a, &b), *expected, "{:?} vs {:?}", a, b);
+            assert_eq!(syllable_distance(&b, &a), *expected, "{:?} vs {:?}", b, a);
+        }
+    }
+
+    #[test]
+    fn test_feature_bits_match_feature_slots() {
+        for (a, fa) in FEATURES.iter() {
+            for (b, fb) in FEATURES.iter() {
+                let expected = if fa[0] != fb[0] {
+                    CROSS_TYPE_DISTANCE
+                } else {
+                    fa.iter().zip(fb.iter()).filter(|(x, y)| x != y).count() as i32
+                };
+                assert_eq!(phoneme_distance(a, b), expected, "{} vs {}", a, b);
+            }
+        }
+    }
+
+    #[test]
+    fn test_code_distance_matches_string_distance() {
+        let labels: Vec<String> = ["K", "AE1", "AE0", "P", "B", "IY2", "NG", "XX", "XX1", "QQ"]
+            .iter()
+            .map(|s| s.to_string())
+            .collect();
+        let mut encoder = PhonemeEncoder::new();
+        let codes = encoder.encode(&labels);
+        for (a, ca) in labels.iter().zip(&codes) {
+            for (b, cb) in labels.iter().zip(&codes) {
+                assert_eq!(code_distance(*ca, *cb), phoneme_distance(a, b), "{} vs {}", a, b);
+            }
+        }
+        for (a, b) in [(0, 3), (1, 3), (2, 10), (0, 0)] {
+            assert_eq!(
+                syllable_code_distance(&codes[..a], &codes[..b]),
+                syllable_distance(&labels[..a], &labels[..b]),
+            );
+        }
+    }
+
+    #[test]
+    fn test_encode_all_matches_encode() {
+        let syllables: Vec<Vec<String>> = [&["K", "AE1", "T"][..], &[], &["XX", "AH0"]]
+            .iter()
+            .map(|s| s.iter().map(|p| p.to_string()).collect())
+            .collect();
+        let mut encoder = PhonemeEncoder::new();
+        let encoded = encoder.encode_all(syllables.iter().map(Vec::as_slice));
+        assert_eq!(encoded.len(), 3);
+        let mut check = PhonemeEncoder::new();
+        let expected: Vec<Vec<u16>> = syllables.iter().map(|s| check.encode(s)).collect();
+        for (i, codes) in encoded.iter().enumerate() {
+            assert_eq!(codes, expected[i].as_slice());
+            assert_eq!(encoded.get(i), codes);
+        }
+    }
+
+    #[test]
+    fn test_syllable_distance_matrix() {
+        let syllables: Vec<Vec<String>> = [&["K", "AE1", "T"][..], &["B", "AE1", "T"], &["AH0"]]
+            .iter()
+            .map(|s| s.iter().map(|p| p.to_string()).collect())
+            .collect();
+        let mut encoder = PhonemeEncoder::new();
+        let rows = encoder.encode_all(syllables[..2].iter().map(Vec::as_slice));
+        let cols = encoder.encode_all(syllables.iter().map(Vec::as_slice));
+        let matrix = syllable_distance_matrix(&rows, &cols);
+        assert_eq!(matrix.len(), 2);
+        for (row, a) in matrix.iter().zip(&syllables) {
+            let expected: Vec<i32> = syllables.iter().map(|b| syllable_distance(a, b)).collect();
+            assert_eq!(row, &expected);
+        }
+    }
+
     #[test]
     fn test_normalize_phoneme_ipa_vowel() {
         assert_eq!(normalize_phoneme("æ"), "AE");
@@ -216,9 +443,10 @@ mod tests {
     }
 
     #[test]
-    fn test_strip_stress() {
-        assert_eq!(strip_stress("AE1"), "AE");
-        assert_eq!(strip_stress("K"), "K");
-        assert_eq!(strip_stress("IY0"), "IY");
+    fn test_normalize_phoneme_length_marker_and_prefix() {
+        assert_eq!(normalize_phoneme("iː"), "IY");
+        assert_eq!(normalize_phoneme("aɪː"), "AY");
+        assert_eq!(normalize_phoneme("tʃ"), "T"); // falls back to prefix match
+        assert_eq!(normalize_phoneme("ʔ"), "ʔ"); // unmapped passes through
     }
 }
@@ -59,7 +59,19 @@ fn extract_stress(phoneme_labels: &[String]) -> Option<u8> {
 
 /// Return true if label is a real phoneme (not punctuation or empty).
 fn is_phoneme(label: &str) -> bool {
-    !label.is_empty() && label.chars().next().map(|c| c.is_alphabetic()).unwrap_or(false)
+    // Only the first char decides; an empty label has none
+    label.chars().next().is_some_and(char::is_alphabetic)
+}
+
+/// A syllable's real phonemes as normalized ARPABET labels, in one pass.
+///
+/// Punctuation and empty labels are dropped; IPA labels are converted.
+pub fn syllable_labels(syl: &Syllable) -> Vec<String> {
+    syl.phonemes
+        .iter()
+        .filter(|p| is_phoneme(&p.label))
+        .map(|p| normalize_phoneme(&p.label))
+        .collect()
 }
 
 /// Build a syllable bank from aligned source syllables.
@@ -69,12 +81,7 @@ fn is_phoneme(label: &str) -> bool {
 pub fn build_bank(syllables: &[Syllable], source_path: &str) -> Vec<SyllableEntry> {
     let mut entries = Vec::new();
     for (i, syl) in syllables.iter().enumerate() {
-        let labels: Vec<String> = syl
-            .phonemes
-            .iter()
-            .filter(|p| is_phoneme(&p.label))
-            .map(|p| normalize_phoneme(&p.label))
-            .collect();
+        let labels = syllable_labels(syl);
 
         if labels.is_empty() {
             continue;
@@ -115,6 +122,16 @@ mod tests {
         }
     }
 
+    #[test]
+    fn test_is_phoneme() {
+        for label in ["B", "AH1", "SH", "ʃ"] {
+            assert!(is_phoneme(label), "{}", label);
+        }
+        for label in [",", ".", "!", "?", ""] {
+            assert!(!is_phoneme(label), "{:?}", label);
+        }
+    }
+
     #[test]
     fn test_build_bank_basic() {
         let syls = vec![make_syl(
@@ -82,7 +82,7 @@ pub fn text_to_syllables(text: &str) -> Vec<TextSyllable> {
             Ok(syls) if !syls.is_empty() => syls,
             _ => {
                 // Fallback: treat all phonemes as a single syllable
-                vec![(vec![], filtered.clone(), vec![])]
+                vec![(vec![], filtered, vec![])]
             }
         };
 
@@ -95,7 +95,7 @@ pub fn text_to_syllables(text: &str) -> Vec<TextSyllable> {
             result.push(TextSyllable {
                 stress: extract_stress(&syl_phonemes),
                 phonemes: syl_phonemes,
-                word: strip_punct(word),
+                word: clean.clone(),
                 word_index: wi,
             });
         }